@@ -19,20 +19,19 @@ setup(
         "Topic :: Security",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "requests>=2.28.0",
-        "aiohttp>=3.8.0",
+        "aiohttp>=3.9.0",
         "beautifulsoup4>=4.11.0",
         "pyyaml>=6.0.0",
         "rich>=12.0.0",
         "click>=8.1.0",
+        "numpy>=1.22.0",
     ],
     extras_require={
         'dev': [
@@ -1,6 +1,10 @@
 import asyncio
+import functools
+import operator
+import os
+import random
 import socket
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Sequence, Set, Tuple
 import time
 from dataclasses import dataclass
 import aiohttp
@@ -8,8 +12,10 @@ import struct
 import logging
 from concurrent.futures import ThreadPoolExecutor
 
+BANNER_CHUNK_SIZE = 256
 
-@dataclass
+
+@dataclass(slots=True)
 class PortScanResult:
     port: int
     state: str  # 'open', 'closed', 'filtered'
@@ -18,60 +24,103 @@ class PortScanResult:
     response_time: float
 
 
+@functools.lru_cache(maxsize=None)
+def _lookup_service(port: int) -> Optional[str]:
+    """Look up a TCP service name from the system services database"""
+    try:
+        return socket.getservbyport(port, 'tcp').upper()
+    except OSError:
+        return None
+
+
 class PortScanner:
+    # Common service ports
+    service_ports = {
+        20: 'FTP-DATA', 21: 'FTP', 22: 'SSH', 23: 'TELNET',
+        25: 'SMTP', 53: 'DNS', 80: 'HTTP', 110: 'POP3',
+        111: 'RPCBIND', 135: 'MSRPC', 139: 'NETBIOS',
+        143: 'IMAP', 443: 'HTTPS', 445: 'SMB',
+        993: 'IMAPS', 995: 'POP3S', 1723: 'PPTP',
+        3306: 'MYSQL', 3389: 'RDP', 5900: 'VNC',
+        8080: 'HTTP-PROXY'
+    }
+
     def __init__(self,
                  concurrency: int = 100,
                  timeout: float = 2.0,
-                 common_ports: bool = True):
+                 common_ports: bool = True,
+                 raw_syn: bool = False):
         self.concurrency = concurrency
         self.timeout = timeout
         self.common_ports = common_ports
+        self.raw_syn = raw_syn
         self.executor = ThreadPoolExecutor(max_workers=concurrency)
         self.logger = logging.getLogger("nexus.portscanner")
 
-        # Common service ports
-        self.service_ports = {
-            20: 'FTP-DATA', 21: 'FTP', 22: 'SSH', 23: 'TELNET',
-            25: 'SMTP', 53: 'DNS', 80: 'HTTP', 110: 'POP3',
-            111: 'RPCBIND', 135: 'MSRPC', 139: 'NETBIOS',
-            143: 'IMAP', 443: 'HTTPS', 445: 'SMB',
-            993: 'IMAPS', 995: 'POP3S', 1723: 'PPTP',
-            3306: 'MYSQL', 3389: 'RDP', 5900: 'VNC',
-            8080: 'HTTP-PROXY'
-        }
+        # Default port list is fixed for the scanner's lifetime
+        if common_ports:
+            self._default_ports: Tuple[int, ...] = tuple(sorted(self.service_ports))
+        else:
+            self._default_ports = tuple(range(1, 1025))  # Well-known ports
 
-    async def scan_target(self, target: str, port_range: Optional[List[int]] = None) -> List[PortScanResult]:
+    async def scan_target(self, target: str, port_range: Optional[Sequence[int]] = None) -> List[PortScanResult]:
         """Scan target for open ports"""
         ports = port_range or self._get_ports_to_scan()
         results = []
 
-        # Create scan tasks
-        tasks = []
-        sem = asyncio.Semaphore(self.concurrency)
+        # Resolve once up front so each port probe connects by address
+        address = await self._resolve_target(target)
 
-        for port in ports:
-            task = asyncio.create_task(
-                self._scan_port_with_semaphore(sem, target, port)
-            )
-            tasks.append(task)
+        # Prefer a half-open SYN scan when we have raw socket privileges
+        if self.raw_syn and self._can_syn_scan():
+            try:
+                results.extend(await self._syn_scan(address, ports))
+            except OSError as e:
+                self.logger.debug(f"SYN scan unavailable, using connect scan: {str(e)}")
+
+        if not results:
+            # Create scan tasks
+            tasks = []
+            sem = asyncio.Semaphore(self.concurrency)
 
-        # Execute scans
-        scan_results = await asyncio.gather(*tasks)
-        results.extend([r for r in scan_results if r is not None])
+            for port in ports:
+                task = asyncio.create_task(
+                    self._scan_port_with_semaphore(sem, address, port)
+                )
+                tasks.append(task)
+
+            # Execute scans
+            scan_results = await asyncio.gather(*tasks)
+            results.extend([r for r in scan_results if r is not None])
 
         # Get service banners for open ports
         banner_tasks = []
         for result in results:
             if result.state == 'open':
                 task = asyncio.create_task(
-                    self._get_service_banner(target, result)
+                    self._get_service_banner(target, address, result)
                 )
                 banner_tasks.append(task)
 
         if banner_tasks:
             await asyncio.gather(*banner_tasks)
 
-        return sorted(results, key=lambda x: x.port)
+        results.sort(key=operator.attrgetter('port'))
+        return results
+
+    async def _resolve_target(self, target: str) -> str:
+        """Resolve target hostname to an IPv4 address"""
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(
+                target, None,
+                family=socket.AF_INET,
+                type=socket.SOCK_STREAM
+            )
+            return infos[0][4][0]
+        except (socket.gaierror, IndexError) as e:
+            self.logger.debug(f"Error resolving {target}: {str(e)}")
+            return target
 
     async def _scan_port_with_semaphore(self,
                                         sem: asyncio.Semaphore,
@@ -106,7 +155,7 @@ class PortScanner:
         return PortScanResult(
             port=port,
             state=state,
-            service=self.service_ports.get(port),
+            service=self._get_service_name(port),
             banner=None,
             response_time=scan_time
         )
@@ -122,16 +171,140 @@ class PortScanner:
         finally:
             sock.close()
 
-    async def _get_service_banner(self, target: str, result: PortScanResult):
+    def _can_syn_scan(self) -> bool:
+        """Check whether raw TCP sockets can be opened"""
+        return hasattr(os, 'geteuid') and os.geteuid() == 0
+
+    async def _syn_scan(self, address: str, ports: Sequence[int]) -> List[PortScanResult]:
+        """Scan ports with raw TCP SYN probes sharing a single socket"""
+        loop = asyncio.get_running_loop()
+        source = self._get_source_address(address)
+        source_port = random.randint(1024, 65535)
+
+        pending: Set[int] = set(ports)
+        states: Dict[int, str] = {}
+        sent_at: Dict[int, float] = {}
+        response_times: Dict[int, float] = {}
+        finished = loop.create_future()
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+        sock.setblocking(False)
+
+        def on_readable():
+            while True:
+                try:
+                    packet = sock.recv(65535)
+                except (BlockingIOError, InterruptedError):
+                    return
+
+                reply = self._parse_syn_reply(packet, address, source_port)
+                if reply is None or reply[0] not in pending:
+                    continue
+
+                port, state = reply
+                sent = sent_at.get(port)
+                if sent is None:
+                    # Stray reply for a port whose SYN has not gone out yet
+                    continue
+                pending.discard(port)
+                states[port] = state
+                response_times[port] = time.time() - sent
+                if not pending and not finished.done():
+                    finished.set_result(None)
+
+        loop.add_reader(sock.fileno(), on_readable)
+        try:
+            for port in ports:
+                packet = self._build_syn_packet(source, address, source_port, port)
+                while True:
+                    try:
+                        sock.sendto(packet, (address, 0))
+                        break
+                    except BlockingIOError:
+                        await asyncio.sleep(0.001)
+                sent_at[port] = time.time()
+
+            try:
+                await asyncio.wait_for(finished, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            loop.remove_reader(sock.fileno())
+            sock.close()
+
+        # Ports that never answered are treated as filtered
+        return [
+            PortScanResult(
+                port=port,
+                state=states.get(port, 'filtered'),
+                service=self._get_service_name(port),
+                banner=None,
+                response_time=response_times.get(port, self.timeout)
+            )
+            for port in ports
+        ]
+
+    def _get_source_address(self, address: str) -> str:
+        """Get the local address used to reach the target"""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect((address, 9))
+            return sock.getsockname()[0]
+
+    def _build_syn_packet(self, source: str, address: str, source_port: int, port: int) -> bytes:
+        """Build a TCP SYN segment with a valid checksum"""
+        header = struct.pack(
+            '!HHIIBBHHH',
+            source_port, port,
+            random.getrandbits(32), 0,
+            5 << 4, 0x02,  # data offset, SYN flag
+            1024, 0, 0
+        )
+        pseudo_header = socket.inet_aton(source) + socket.inet_aton(address) + struct.pack(
+            '!BBH', 0, socket.IPPROTO_TCP, len(header)
+        )
+        checksum = self._checksum(pseudo_header + header)
+        return header[:16] + struct.pack('!H', checksum) + header[18:]
+
+    @staticmethod
+    def _checksum(data: bytes) -> int:
+        """Compute the ones' complement checksum used by TCP/IP"""
+        if len(data) % 2:
+            data += b'\0'
+        total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+        total = (total >> 16) + (total & 0xFFFF)
+        total += total >> 16
+        return ~total & 0xFFFF
+
+    def _parse_syn_reply(self, packet: bytes, address: str, source_port: int) -> Optional[Tuple[int, str]]:
+        """Classify a raw IP/TCP reply as open (SYN/ACK) or closed (RST)"""
+        if len(packet) < 20 or socket.inet_ntoa(packet[12:16]) != address:
+            return None
+
+        ip_header_len = (packet[0] & 0x0F) * 4
+        if len(packet) < ip_header_len + 14:
+            return None
+
+        port, dest_port = struct.unpack('!HH', packet[ip_header_len:ip_header_len + 4])
+        if dest_port != source_port:
+            return None
+
+        flags = packet[ip_header_len + 13]
+        if flags & 0x12 == 0x12:
+            return port, 'open'
+        if flags & 0x04:
+            return port, 'closed'
+        return None
+
+    async def _get_service_banner(self, target: str, address: str, result: PortScanResult):
         """Attempt to get service banner"""
         try:
-            banner = await self._fetch_banner(target, result.port)
+            banner = await self._fetch_banner(target, address, result.port)
             if banner:
                 result.banner = banner.strip()
         except Exception as e:
             self.logger.debug(f"Error getting banner for port {result.port}: {str(e)}")
 
-    async def _fetch_banner(self, target: str, port: int) -> Optional[str]:
+    async def _fetch_banner(self, target: str, address: str, port: int) -> Optional[str]:
         """Fetch service banner using common protocols"""
         protocols = {
             80: self._http_banner,
@@ -142,28 +315,31 @@ class PortScanner:
         }
 
         if port in protocols:
-            return await protocols[port](target, port)
+            return await protocols[port](target, address, port)
 
-        return await self._generic_banner(target, port)
+        return await self._generic_banner(target, address, port)
 
-    async def _http_banner(self, target: str, port: int) -> Optional[str]:
+    async def _http_banner(self, target: str, address: str, port: int) -> Optional[str]:
         """Get HTTP server banner"""
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.get(
-                        f"http://{target}:{port}",
+                        f"http://{address}:{port}",
+                        headers={'Host': target},
                         timeout=self.timeout
                 ) as response:
                     return response.headers.get('Server')
             except:
                 return None
 
-    async def _https_banner(self, target: str, port: int) -> Optional[str]:
+    async def _https_banner(self, target: str, address: str, port: int) -> Optional[str]:
         """Get HTTPS server banner"""
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.get(
-                        f"https://{target}:{port}",
+                        f"https://{address}:{port}",
+                        headers={'Host': target},
+                        server_hostname=target,
                         timeout=self.timeout,
                         verify_ssl=False
                 ) as response:
@@ -171,54 +347,81 @@ class PortScanner:
             except:
                 return None
 
-    async def _ssh_banner(self, target: str, port: int) -> Optional[str]:
+    async def _ssh_banner(self, target: str, address: str, port: int) -> Optional[str]:
         """Get SSH banner"""
         try:
-            reader, writer = await asyncio.open_connection(target, port)
-            banner = await reader.read(1024)
+            reader, writer = await asyncio.open_connection(address, port)
+            banner = await self._read_line(reader)
             writer.close()
             await writer.wait_closed()
             return banner.decode().strip()
         except:
             return None
 
-    async def _ftp_banner(self, target: str, port: int) -> Optional[str]:
+    async def _ftp_banner(self, target: str, address: str, port: int) -> Optional[str]:
         """Get FTP banner"""
         try:
-            reader, writer = await asyncio.open_connection(target, port)
-            banner = await reader.read(1024)
+            reader, writer = await asyncio.open_connection(address, port)
+            banner = await self._read_line(reader)
             writer.close()
             await writer.wait_closed()
             return banner.decode().strip()
         except:
             return None
 
-    async def _smtp_banner(self, target: str, port: int) -> Optional[str]:
+    async def _smtp_banner(self, target: str, address: str, port: int) -> Optional[str]:
         """Get SMTP banner"""
         try:
-            reader, writer = await asyncio.open_connection(target, port)
-            banner = await reader.read(1024)
+            reader, writer = await asyncio.open_connection(address, port)
+            banner = await self._read_line(reader)
             writer.close()
             await writer.wait_closed()
             return banner.decode().strip()
         except:
             return None
 
-    async def _generic_banner(self, target: str, port: int) -> Optional[str]:
+    async def _generic_banner(self, target: str, address: str, port: int) -> Optional[str]:
         """Attempt to get banner from unknown service"""
         try:
-            reader, writer = await asyncio.open_connection(target, port)
+            reader, writer = await asyncio.open_connection(address, port)
             writer.write(b'\r\n')
             await writer.drain()
-            banner = await reader.read(1024)
+            # Without a line terminator, take whatever the service sent in time
+            banner = await self._read_line(reader, partial=True)
             writer.close()
             await writer.wait_closed()
             return banner.decode().strip()
         except:
             return None
 
-    def _get_ports_to_scan(self) -> List[int]:
-        """Get list of ports to scan based on configuration"""
-        if self.common_ports:
-            return sorted(self.service_ports.keys())
-        return list(range(1, 1025))  # Well-known ports
+    async def _read_line(self, reader: asyncio.StreamReader, partial: bool = False) -> bytes:
+        """Read a single banner line, returning as soon as it arrives.
+
+        Everything shares one timeout. With ``partial``, a service that never
+        ends its line yields the bytes received by then instead of a timeout.
+        """
+        received = bytearray()
+
+        async def read_until_newline():
+            while b'\n' not in received:
+                chunk = await reader.read(BANNER_CHUNK_SIZE)
+                if not chunk:
+                    break
+                received.extend(chunk)
+
+        try:
+            await asyncio.wait_for(read_until_newline(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            if not (partial and received):
+                raise
+
+        line, newline, _ = bytes(received).partition(b'\n')
+        return line + newline
+
+    def _get_service_name(self, port: int) -> Optional[str]:
+        """Get service name for port, falling back to the system services database"""
+        return self.service_ports.get(port) or _lookup_service(port)
+
+    def _get_ports_to_scan(self) -> Tuple[int, ...]:
+        """Get ports to scan based on configuration"""
+        return self._default_ports
@@ -9,7 +9,19 @@ from concurrent.futures import ThreadPoolExecutor
 import logging
 
 
-@dataclass
+# Errors meaning the server answered but rejected the handshake
+HANDSHAKE_REJECTIONS = (ssl.SSLError, ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+
+def _parse_generalized_time(value: bytes) -> datetime.datetime:
+    """Parse an ASN.1 GeneralizedTime (YYYYMMDDhhmmssZ) into a naive UTC datetime"""
+    return datetime.datetime(
+        int(value[0:4]), int(value[4:6]), int(value[6:8]),
+        int(value[8:10]), int(value[10:12]), int(value[12:14])
+    )
+
+
+@dataclass(slots=True)
 class SSLCertificate:
     subject: str
     issuer: str
@@ -24,7 +36,7 @@ class SSLCertificate:
     san: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SSLScanResult:
     hostname: str
     port: int
@@ -39,6 +51,7 @@ class SSLScanResult:
 class SSLChecker:
     def __init__(self, timeout: int = 10, concurrent_checks: int = 10):
         self.timeout = timeout
+        self.concurrent_checks = concurrent_checks
         self.executor = ThreadPoolExecutor(max_workers=concurrent_checks)
         self.logger = logging.getLogger("nexus.sslchecker")
 
@@ -52,11 +65,21 @@ class SSLChecker:
     async def check_ssl(self, hostname: str, port: int = 443) -> SSLScanResult:
         """Perform comprehensive SSL/TLS security check"""
         try:
+            # Fetch the certificate first so an unreachable host fails after one timeout
+            cert = await asyncio.wrap_future(
+                self.executor.submit(self._get_certificate, hostname, port)
+            )
+
+            # Cipher probes are independent handshakes, run them concurrently
+            ciphers = await self._check_cipher_suites(hostname, port)
+
             # Run SSL checks in thread pool to avoid blocking
             future = self.executor.submit(
                 self._perform_ssl_checks,
                 hostname,
-                port
+                port,
+                cert,
+                ciphers
             )
             return await asyncio.wrap_future(future)
 
@@ -64,12 +87,13 @@ class SSLChecker:
             self.logger.error(f"SSL check failed for {hostname}:{port} - {str(e)}")
             raise
 
-    def _perform_ssl_checks(self, hostname: str, port: int) -> SSLScanResult:
+    def _perform_ssl_checks(self,
+                            hostname: str,
+                            port: int,
+                            cert: OpenSSL.crypto.X509,
+                            ciphers: List[str]) -> SSLScanResult:
         """Execute all SSL security checks"""
-        context = self._create_ssl_context()
-        cert = self._get_certificate(hostname, port)
         protocols = self._check_protocols(hostname, port)
-        ciphers = self._check_cipher_suites(hostname, port)
 
         vulnerabilities = []
         warnings = []
@@ -102,7 +126,8 @@ class SSLChecker:
 
     def _create_ssl_context(self) -> ssl.SSLContext:
         """Create SSL context for testing"""
-        context = ssl.create_default_context()
+        # Certificates are never verified, so skip loading the system CA store
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
         context.check_hostname = False
         context.verify_mode = ssl.CERT_NONE
         context.set_ciphers('ALL:@SECLEVEL=0')
@@ -146,16 +171,90 @@ class SSLChecker:
 
         return protocols
 
-    def _check_cipher_suites(self, hostname: str, port: int) -> List[str]:
-        """Check supported cipher suites"""
+    async def _check_cipher_suites(self, hostname: str, port: int) -> List[str]:
+        """Check cipher suites the server accepts, one handshake per cipher"""
+        # TLS 1.3 suites cannot be restricted through set_ciphers, so those
+        # are covered by a single handshake reporting the negotiated suite
+        candidates = [
+            cipher['name']
+            for cipher in self._create_ssl_context().get_ciphers()
+            if cipher['protocol'] != 'TLSv1.3'
+        ]
+
+        sem = asyncio.Semaphore(self.concurrent_checks)
+        # Set once the host stops answering, so queued probes are skipped
+        unreachable = asyncio.Event()
+        results = await asyncio.gather(
+            self._probe_tls13_cipher(sem, unreachable, hostname, port),
+            *(
+                self._probe_cipher(sem, unreachable, hostname, port, cipher)
+                for cipher in candidates
+            )
+        )
+
+        return [cipher for cipher in results if cipher]
+
+    async def _probe_cipher(self,
+                            sem: asyncio.Semaphore,
+                            unreachable: asyncio.Event,
+                            hostname: str,
+                            port: int,
+                            cipher: str) -> Optional[str]:
+        """Return the cipher name if a TLS <= 1.2 handshake using only it succeeds"""
         context = self._create_ssl_context()
-        ciphers = []
+        context.maximum_version = ssl.TLSVersion.TLSv1_2
+        try:
+            context.set_ciphers(f'{cipher}:@SECLEVEL=0')
+        except ssl.SSLError:
+            return None
+
+        return await self._handshake_cipher(sem, unreachable, hostname, port, context)
+
+    async def _probe_tls13_cipher(self,
+                                  sem: asyncio.Semaphore,
+                                  unreachable: asyncio.Event,
+                                  hostname: str,
+                                  port: int) -> Optional[str]:
+        """Return the suite negotiated over TLS 1.3, if supported"""
+        context = self._create_ssl_context()
+        context.minimum_version = ssl.TLSVersion.TLSv1_3
+        return await self._handshake_cipher(sem, unreachable, hostname, port, context)
+
+    async def _handshake_cipher(self,
+                                sem: asyncio.Semaphore,
+                                unreachable: asyncio.Event,
+                                hostname: str,
+                                port: int,
+                                context: ssl.SSLContext) -> Optional[str]:
+        """Perform a handshake and report the negotiated cipher"""
+        async with sem:
+            if unreachable.is_set():
+                return None
 
-        with socket.create_connection((hostname, port), timeout=self.timeout) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssl_sock:
-                ciphers = ssl_sock.shared_ciphers()
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(
+                        hostname, port,
+                        ssl=context,
+                        server_hostname=hostname
+                    ),
+                    timeout=self.timeout
+                )
+            except HANDSHAKE_REJECTIONS:
+                # The server refused this cipher, other probes are still worth running
+                return None
+            except (OSError, asyncio.TimeoutError):
+                unreachable.set()
+                return None
+
+            negotiated = writer.get_extra_info('cipher')
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
 
-        return [cipher[0] for cipher in ciphers] if ciphers else []
+        return negotiated[0] if negotiated else None
 
     def _parse_certificate(self, cert: OpenSSL.crypto.X509) -> SSLCertificate:
         """Parse certificate information"""
@@ -174,14 +273,8 @@ class SSLChecker:
             issuer=issuer.get(b'CN', b'').decode(),
             version=cert.get_version(),
             serial_number=hex(cert.get_serial_number()),
-            not_before=datetime.datetime.strptime(
-                cert.get_notBefore().decode(),
-                '%Y%m%d%H%M%SZ'
-            ),
-            not_after=datetime.datetime.strptime(
-                cert.get_notAfter().decode(),
-                '%Y%m%d%H%M%SZ'
-            ),
+            not_before=_parse_generalized_time(cert.get_notBefore()),
+            not_after=_parse_generalized_time(cert.get_notAfter()),
             signature_algorithm=cert.get_signature_algorithm().decode(),
             public_key_bits=cert.get_pubkey().bits(),
             public_key_type=cert.get_pubkey().type_name(),
@@ -198,10 +291,7 @@ class SSLChecker:
     ):
         """Check certificate validity and security"""
         now = datetime.datetime.utcnow()
-        not_after = datetime.datetime.strptime(
-            cert.get_notAfter().decode(),
-            '%Y%m%d%H%M%SZ'
-        )
+        not_after = _parse_generalized_time(cert.get_notAfter())
 
         # Check expiration
         if now > not_after:
@@ -1,4 +1,6 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
 import re
 import json
 import logging
@@ -9,7 +11,7 @@ from dataclasses import dataclass
 import concurrent.futures
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Technology:
     name: str
     category: str
@@ -19,11 +21,22 @@ class Technology:
     cpe: Optional[str] = None
 
 
+# Detections keyed by (name, version)
+TechnologyMap = Dict[Tuple[str, Optional[str]], Technology]
+
+
 class TechDetector:
-    def __init__(self, signatures_path: Optional[str] = None):
+    def __init__(self, signatures_path: Optional[str] = None, cache_size: int = 256):
         self.logger = logging.getLogger("nexus.techdetector")
         self.signatures = self._load_signatures(signatures_path)
         self._pattern_cache: Dict[str, re.Pattern] = {}
+        self._result_cache: OrderedDict[bytes, List[Technology]] = OrderedDict()
+        self._cache_size = cache_size
+        self._fingerprint_headers = sorted({
+            header.lower()
+            for signature in self.signatures.get('headers', {}).values()
+            for header in signature
+        })
         self.headers = {
             'User-Agent': 'Nexus-Scanner/1.0',
             'Accept': '*/*'
@@ -49,17 +62,24 @@ class TechDetector:
             response = requests.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            detected: Set[Technology] = set()
+            # Identical pages produce identical detections
+            fingerprint = self._fingerprint(response)
+            cached = self._result_cache.get(fingerprint)
+            if cached is not None:
+                self._result_cache.move_to_end(fingerprint)
+                return list(cached)
 
-            # Extract all scripts
-            scripts = [script.get('src', '') for script in soup.find_all('script')]
+            soup = BeautifulSoup(response.text, 'html.parser')
+            detected: TechnologyMap = {}
 
-            # Extract meta tags
-            meta_tags = {
-                meta.get('name', '').lower(): meta.get('content', '')
-                for meta in soup.find_all('meta')
-            }
+            # Extract scripts and meta tags in a single tree walk
+            scripts = []
+            meta_tags = {}
+            for tag in soup.find_all(['script', 'meta']):
+                if tag.name == 'script':
+                    scripts.append(tag.get('src', ''))
+                else:
+                    meta_tags[tag.get('name', '').lower()] = tag.get('content', '')
 
             # Check headers
             self._check_headers(response.headers, detected)
@@ -76,51 +96,65 @@ class TechDetector:
             # Check meta patterns
             self._check_meta_patterns(meta_tags, detected)
 
-            return list(detected)
+            technologies = list(detected.values())
+            self._result_cache[fingerprint] = technologies
+            if len(self._result_cache) > self._cache_size:
+                self._result_cache.popitem(last=False)
+
+            return list(technologies)
 
         except Exception as e:
             self.logger.error(f"Error detecting technologies for {url}: {str(e)}")
             return []
 
-    def _check_headers(self, headers: Dict, detected: Set[Technology]):
+    def _fingerprint(self, response: requests.Response) -> bytes:
+        """Hash the page body plus the headers and cookies signatures look at"""
+        digest = hashlib.blake2b(response.content, digest_size=16)
+        for header in self._fingerprint_headers:
+            digest.update(b'\0' + response.headers.get(header, '').encode())
+        for cookie_name in sorted(response.cookies.keys()):
+            digest.update(b'\0' + cookie_name.encode())
+        return digest.digest()
+
+    def _check_headers(self, headers: Dict, detected: TechnologyMap):
         """Check response headers for technology signatures"""
         for tech_name, signature in self.signatures.get('headers', {}).items():
             for header, pattern in signature.items():
                 if header.lower() in headers:
                     if self._match_pattern(pattern, headers[header.lower()]):
                         version = self._extract_version(headers[header.lower()], signature.get('version_pattern'))
-                        detected.add(Technology(
+                        self._add_detection(detected, Technology(
                             name=tech_name,
                             category='Server',
                             version=version,
                             confidence=0.9
                         ))
 
-    def _check_cookies(self, cookies: Dict, detected: Set[Technology]):
+    def _check_cookies(self, cookies: Dict, detected: TechnologyMap):
         """Check cookies for technology signatures"""
         for tech_name, signature in self.signatures.get('cookies', {}).items():
             for cookie_name in signature:
                 if cookie_name in cookies:
-                    detected.add(Technology(
+                    self._add_detection(detected, Technology(
                         name=tech_name,
                         category='Framework',
                         confidence=0.8
                     ))
 
-    def _check_html_patterns(self, html: str, detected: Set[Technology]):
+    def _check_html_patterns(self, html: str, detected: TechnologyMap):
         """Check HTML content for technology patterns"""
         for tech_name, signature in self.signatures.get('html_patterns', {}).items():
             for pattern in signature:
                 if self._match_pattern(pattern, html):
                     version = self._extract_version(html, signature.get('version_pattern'))
-                    detected.add(Technology(
+                    self._add_detection(detected, Technology(
                         name=tech_name,
                         category='Frontend',
                         version=version,
                         confidence=0.7
                     ))
 
-    def _check_script_patterns(self, script_patterns: List[str], scripts: List[str], detected: Set[Technology]):
+    def _check_script_patterns(self, script_patterns: List[str], scripts: List[str], detected: TechnologyMap):
         """Check script sources for technology patterns"""
         for pattern in script_patterns:
             if pattern not in self._pattern_cache:
@@ -128,23 +162,30 @@ class TechDetector:
 
             for script in scripts:
                 if self._pattern_cache[pattern].search(script):
-                    detected.add(Technology(
+                    self._add_detection(detected, Technology(
                         name=self._get_script_tech_name(pattern),
                         category='JavaScript',
                         confidence=0.8
                     ))
 
-    def _check_meta_patterns(self, meta_tags: Dict, detected: Set[Technology]):
+    def _check_meta_patterns(self, meta_tags: Dict, detected: TechnologyMap):
         """Check meta tags for technology signatures"""
         for tech_name, signature in self.signatures.get('meta_patterns', {}).items():
             for meta_name, pattern in signature.items():
                 if meta_name in meta_tags and self._match_pattern(pattern, meta_tags[meta_name]):
-                    detected.add(Technology(
+                    self._add_detection(detected, Technology(
                         name=tech_name,
                         category='Meta',
                         confidence=0.6
                     ))
 
+    def _add_detection(self, detected: TechnologyMap, tech: Technology):
+        """Record a detection, keeping the highest confidence per name and version"""
+        key = (tech.name, tech.version)
+        existing = detected.get(key)
+        if existing is None or tech.confidence > existing.confidence:
+            detected[key] = tech
+
     def _match_pattern(self, pattern: str, text: str) -> bool:
         """Match pattern against text"""
         if pattern not in self._pattern_cache:
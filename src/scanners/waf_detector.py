@@ -1,30 +1,77 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Mapping, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from urllib.parse import urlsplit
 import aiohttp
 import asyncio
 import json
 from pathlib import Path
+import itertools
 import logging
-from dataclasses import dataclass
+import operator
+from dataclasses import dataclass, field
 import random
+import re
+import sys
 import time
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Active detection stops probing once a payload reaches this confidence
+DECISIVE_CONFIDENCE = 0.8
+
+# Common WAF blocking patterns in connection errors, checked in order
+ERROR_PATTERNS = (
+    (re.compile('connection reset', re.IGNORECASE), 'connection_reset', 0.7),
+    (re.compile('timeout', re.IGNORECASE), 'timeout', 0.5),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class WAFDetection:
     name: str
     confidence: float
     version: Optional[str] = None
-    details: Optional[Dict[str, str]] = None
+    details: Optional[Dict[str, str]] = field(default=None, hash=False)
 
 
 class WAFDetector:
-    def __init__(self, signatures_path: Optional[str] = None):
+    def __init__(self,
+                 signatures_path: Optional[str] = None,
+                 cache_ttl: float = 3600,
+                 cache_size: int = 256):
         self.logger = logging.getLogger("nexus.wafdetector")
         self.signatures = self._load_signatures(signatures_path)
+        self._body_patterns = self._collect_body_patterns()
+        self._body_matcher = self._build_body_matcher()
+        self._body_re = None if self._body_matcher else self._build_body_regex()
+        self._sig_headers_lc = self._build_header_signatures()
+        self._max_body_scores = {
+            waf_name: 0.3 * len(signature['body_patterns'])
+            for waf_name, signature in self.signatures.items()
+            if signature.get('body_patterns')
+        }
         self.user_agents = self._load_user_agents()
+        # Rotate through user agents in a random order fixed at startup
+        self._ua_cycle = itertools.cycle(random.sample(self.user_agents, len(self.user_agents)))
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Detection results per (scheme, host) with the time they were stored
+        self._host_cache: OrderedDict[Tuple[str, str], Tuple[float, Optional[WAFDetection]]] = OrderedDict()
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
 
         # Test payloads for WAF detection
-        self.test_payloads = [
+        self.test_payloads: Tuple[str, ...] = tuple(sys.intern(payload) for payload in (
             "' OR '1'='1",
             "<script>alert(1)</script>",
             "../../../etc/passwd",
@@ -33,7 +80,10 @@ class WAFDetector:
             "/?param=/*!50000SELECT*/",
             "/?param=union select password from users",
             "/?param=eval(base64_decode('PHN2Zy9vbmxvYWQ9YWxlcnQoMSk+'))"
-        ]
+        ))
+
+        # Baseline URL plus one URL per payload, built once per target URL
+        self._payload_cache: OrderedDict[str, Tuple[str, ...]] = OrderedDict()
 
     def _load_signatures(self, signatures_path: Optional[str]) -> Dict[str, Dict]:
         """Load WAF signatures from file"""
@@ -42,118 +92,243 @@ class WAFDetector:
         else:
             path = Path(__file__).parent / "data" / "waf_signatures.json"
 
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+
         with open(path) as f:
             return json.load(f)
 
-    def _load_user_agents(self) -> List[str]:
+    def _build_header_signatures(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Pre-lowercase header signatures as (header, pattern) pairs per WAF"""
+        return {
+            waf_name: [
+                (header.lower(), pattern.lower())
+                for header, pattern in signature['headers'].items()
+            ]
+            for waf_name, signature in self.signatures.items()
+            if 'headers' in signature
+        }
+
+    def _collect_body_patterns(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """Collect lowercased body patterns with the WAFs that use them"""
+        owners: Dict[str, List[str]] = defaultdict(list)
+        for waf_name, signature in self.signatures.items():
+            for pattern in signature.get('body_patterns', []):
+                owners[pattern.lower()].append(waf_name)
+
+        return [(pattern, tuple(waf_names)) for pattern, waf_names in owners.items()]
+
+    def _build_body_matcher(self):
+        """Build an Aho-Corasick automaton over every signature body pattern"""
+        if ahocorasick is None or not self._body_patterns:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for index, (pattern, _) in enumerate(self._body_patterns):
+            automaton.add_word(pattern, index)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_body_regex(self) -> Optional[re.Pattern]:
+        """Build a single alternation that finds whether any body pattern occurs"""
+        if not self._body_patterns:
+            return None
+
+        return re.compile('|'.join(re.escape(pattern) for pattern, _ in self._body_patterns))
+
+    def _load_user_agents(self) -> Tuple[str, ...]:
         """Load list of user agents for detection"""
-        return [
+        return tuple(sys.intern(agent) for agent in (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Nexus Security Scanner/1.0"
-        ]
+        ))
+
+    def _payload_urls(self, url: str) -> Tuple[str, ...]:
+        """Get the baseline URL followed by every payload test URL"""
+        urls = self._payload_cache.get(url)
+        if urls is None:
+            urls = (url, *(f"{url}{payload}" for payload in self.test_payloads))
+            self._payload_cache[url] = urls
+            if len(self._payload_cache) > self._cache_size:
+                self._payload_cache.popitem(last=False)
+        return urls
+
+    async def __aenter__(self) -> 'WAFDetector':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            # Sessions are bound to the loop that created them, e.g. an earlier asyncio.run
+            self._session.detach()
+            self._session = None
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            else:
+                self._session.detach()
+            self._session = None
+            self._session_loop = None
 
     async def detect_waf(self, url: str) -> Optional[WAFDetection]:
         """Detect WAF presence and type"""
-        detected_wafs: Set[WAFDetection] = set()
-
-        # Perform passive detection first
-        passive_detection = await self._passive_detection(url)
-        if passive_detection:
-            detected_wafs.add(passive_detection)
-
-        # Perform active detection if needed
-        if not detected_wafs:
-            active_detections = await self._active_detection(url)
-            detected_wafs.update(active_detections)
+        parts = urlsplit(url)
+        host = (parts.scheme, parts.netloc)
+        cached = self._host_cache.get(host)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            self._host_cache.move_to_end(host)
+            return cached[1]
+
+        detection, responded = await self._detect_waf(url)
+
+        # Without a single HTTP response the outcome says nothing about the host
+        if responded:
+            self._host_cache[host] = (time.monotonic(), detection)
+            self._host_cache.move_to_end(host)
+            if len(self._host_cache) > self._cache_size:
+                self._host_cache.popitem(last=False)
+
+        return detection
+
+    async def _detect_waf(self, url: str) -> Tuple[Optional[WAFDetection], bool]:
+        """Run detection against the target, also reporting whether any probe got a response"""
+        detections, responded = await self._active_detection(url)
+
+        # Keep only the most confident detection per WAF
+        best: Dict[str, WAFDetection] = {}
+        for detection in detections:
+            current = best.get(detection.name)
+            if current is None or detection.confidence > current.confidence:
+                best[detection.name] = detection
 
         # Return the detection with highest confidence
-        if detected_wafs:
-            return max(detected_wafs, key=lambda x: x.confidence)
-        return None
-
-    async def _passive_detection(self, url: str) -> Optional[WAFDetection]:
-        """Perform passive WAF detection through headers"""
-        async with aiohttp.ClientSession() as session:
-            try:
-                headers = {'User-Agent': random.choice(self.user_agents)}
-                async with session.get(url, headers=headers) as response:
-                    headers = dict(response.headers)
-
-                    for waf_name, signature in self.signatures.items():
-                        if 'headers' in signature:
-                            confidence = self._check_headers(headers, signature['headers'])
-                            if confidence > 0:
-                                return WAFDetection(
-                                    name=waf_name,
-                                    confidence=confidence,
-                                    details={'detected_by': 'headers'}
-                                )
-
-            except Exception as e:
-                self.logger.debug(f"Passive detection error: {str(e)}")
-        return None
-
-    async def _active_detection(self, url: str) -> Set[WAFDetection]:
-        """Perform active WAF detection through test payloads"""
-        detections = set()
-        tasks = []
-
-        for payload in self.test_payloads:
-            task = asyncio.create_task(
-                self._test_payload(url, payload)
-            )
-            tasks.append(task)
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, WAFDetection):
-                detections.add(result)
-
-        return detections
-
-    async def _test_payload(self, url: str, payload: str) -> Optional[WAFDetection]:
-        """Test a single payload against the target"""
-        async with aiohttp.ClientSession() as session:
-            try:
-                headers = {
-                    'User-Agent': random.choice(self.user_agents),
-                    'X-Requested-With': 'XMLHttpRequest'
-                }
-
-                test_url = f"{url}{payload}"
-                async with session.get(test_url, headers=headers) as response:
-                    status = response.status
-                    headers = dict(response.headers)
-                    body = await response.text()
-
-                    return self._analyze_response(status, headers, body)
+        if best:
+            return max(best.values(), key=operator.attrgetter('confidence')), responded
+        return None, responded
+
+    async def _active_detection(self, url: str) -> Tuple[List[WAFDetection], bool]:
+        """Perform WAF detection through a baseline request and test payloads"""
+        detections = []
+        responded = False
+        # The first URL is the unmodified target, fetched as a baseline
+        tasks = [
+            asyncio.create_task(self._test_payload(test_url))
+            for test_url in self._payload_urls(url)
+        ]
 
-            except aiohttp.ClientError as e:
-                # Connection errors might indicate WAF blocking
-                return self._analyze_error(e)
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                try:
+                    result, got_response = await next_result
+                except Exception as e:
+                    self.logger.debug(f"Payload test error: {str(e)}")
+                    continue
+
+                responded = responded or got_response
+                if isinstance(result, WAFDetection):
+                    detections.append(result)
+                    # A decisive match makes the remaining payloads redundant
+                    if result.confidence >= DECISIVE_CONFIDENCE:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return detections, responded
+
+    async def _test_payload(self, test_url: str) -> Tuple[Optional[WAFDetection], bool]:
+        """Test a single payload URL, returning any detection and whether the server responded"""
+        session = await self._get_session()
+        try:
+            headers = {
+                'User-Agent': next(self._ua_cycle),
+                'X-Requested-With': 'XMLHttpRequest'
+            }
+
+            async with session.get(test_url, headers=headers) as response:
+                status = response.status
+                body = await response.text()
+
+                return self._analyze_response(status, response.headers, body), True
+
+        except aiohttp.ClientError as e:
+            # Connection errors might indicate WAF blocking
+            return self._analyze_error(e), False
+
+        except Exception as e:
+            self.logger.debug(f"Payload test error: {str(e)}")
+
+        return None, False
+
+    @staticmethod
+    def _lower_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+        """Lowercase response header names and values once per response"""
+        return {name.lower(): value.lower() for name, value in headers.items()}
+
+    def _check_headers(self, headers_lc: Dict[str, str], signatures: List[Tuple[str, str]]) -> float:
+        """Check lowercased response headers against pre-lowercased WAF signatures"""
+        confidence = 0.0
 
-            except Exception as e:
-                self.logger.debug(f"Payload test error: {str(e)}")
+        for header, pattern in signatures:
+            value = headers_lc.get(header)
+            if value is not None and pattern in value:
+                confidence += 0.3
 
-        return None
+        return min(confidence, 1.0)
 
-    def _check_headers(self, headers: Dict[str, str], signatures: Dict[str, str]) -> float:
-        """Check response headers against WAF signatures"""
-        confidence = 0.0
+    def _score_body(self, body: str) -> Dict[str, float]:
+        """Score body pattern matches per WAF in a single pass over the body"""
+        body_lower = body.lower()
+        scores: Dict[str, float] = defaultdict(float)
+
+        if self._body_matcher is not None:
+            matched = {index for _, index in self._body_matcher.iter(body_lower)}
+        elif self._body_re is not None:
+            # The alternation consumes what it matches and so misses overlapping or
+            # prefix patterns; use it only to skip bodies without any pattern at all
+            if self._body_re.search(body_lower) is None:
+                return scores
+            matched = {
+                index for index, (pattern, _) in enumerate(self._body_patterns)
+                if pattern in body_lower
+            }
+        else:
+            return scores
 
-        for header, pattern in signatures.items():
-            header_lower = header.lower()
-            if header_lower in headers:
-                if pattern.lower() in headers[header_lower].lower():
-                    confidence += 0.3
+        for index in matched:
+            for waf_name in self._body_patterns[index][1]:
+                scores[waf_name] += 0.3
 
-        return min(confidence, 1.0)
+        return scores
 
-    def _analyze_response(self, status: int, headers: Dict[str, str], body: str) -> Optional[WAFDetection]:
+    def _analyze_response(self, status: int, headers: Mapping[str, str], body: str) -> Optional[WAFDetection]:
         """Analyze response for WAF fingerprints"""
+        headers_lc = self._lower_headers(headers)
+
+        # Status and header evidence first, these are cheap
+        partial: Dict[str, float] = {}
         for waf_name, signature in self.signatures.items():
             confidence = 0.0
 
@@ -162,14 +337,24 @@ class WAFDetector:
                 confidence += 0.3
 
             # Check response headers
-            if 'headers' in signature:
-                confidence += self._check_headers(headers, signature['headers'])
+            sig_headers = self._sig_headers_lc.get(waf_name)
+            if sig_headers:
+                confidence += self._check_headers(headers_lc, sig_headers)
+
+            partial[waf_name] = confidence
+
+        # Only scan the body if some WAF could still cross the threshold
+        if any(
+            confidence + self._max_body_scores.get(waf_name, 0.0) > 0.5
+            for waf_name, confidence in partial.items()
+        ):
+            body_scores = self._score_body(body)
+        else:
+            body_scores = {}
 
+        for waf_name, confidence in partial.items():
             # Check response body
-            if 'body_patterns' in signature:
-                for pattern in signature['body_patterns']:
-                    if pattern.lower() in body.lower():
-                        confidence += 0.3
+            confidence += body_scores.get(waf_name, 0.0)
 
             if confidence > 0.5:
                 return WAFDetection(
@@ -181,24 +366,31 @@ class WAFDetector:
                     }
                 )
 
+        return self._passive_match(headers_lc)
+
+    def _passive_match(self, headers_lc: Dict[str, str]) -> Optional[WAFDetection]:
+        """Match response headers alone against WAF header signatures"""
+        for waf_name, sig_headers in self._sig_headers_lc.items():
+            confidence = self._check_headers(headers_lc, sig_headers)
+            if confidence > 0:
+                return WAFDetection(
+                    name=waf_name,
+                    confidence=confidence,
+                    details={'detected_by': 'headers'}
+                )
+
         return None
 
     def _analyze_error(self, error: Exception) -> Optional[WAFDetection]:
         """Analyze connection errors for WAF detection"""
-        error_str = str(error).lower()
-
-        # Common WAF blocking patterns
-        if 'connection reset' in error_str:
-            return WAFDetection(
-                name='Unknown WAF',
-                confidence=0.7,
-                details={'detected_by': 'connection_reset'}
-            )
-        elif 'timeout' in error_str:
-            return WAFDetection(
-                name='Unknown WAF',
-                confidence=0.5,
-                details={'detected_by': 'timeout'}
-            )
+        message = str(error)
+
+        for pattern, detected_by, confidence in ERROR_PATTERNS:
+            if pattern.search(message):
+                return WAFDetection(
+                    name='Unknown WAF',
+                    confidence=confidence,
+                    details={'detected_by': detected_by}
+                )
 
         return None
@@ -1,9 +1,10 @@
 from typing import List, Optional, Dict
+from abc import ABC, abstractmethod
 import time
-import threading
 from rich.console import Console
 from rich.live import Live
 from rich.spinner import Spinner
+from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskID
 from rich.panel import Panel
 from .colors import NexusColors
@@ -14,7 +15,6 @@ class Animation:
         self.console = console or Console()
         self.colors = NexusColors()
         self.is_running = False
-        self._thread: Optional[threading.Thread] = None
 
 
 class LoadingAnimation(Animation):
@@ -67,7 +67,51 @@ class ProgressAnimation(Animation):
         return self.progress
 
 
-class ScanAnimation(Animation):
+class _LiveAnimation(Animation, ABC):
+    """Frame-based animation drawn by a rich Live display.
+
+    Rich's refresh thread pulls the current frame through ``__rich__``, and
+    the frame is derived from the time elapsed since ``start``.
+    """
+
+    interval = 0.1
+
+    def __init__(self, console: Optional[Console] = None):
+        super().__init__(console)
+        self._live: Optional[Live] = None
+        self._started_at = 0.0
+
+    @abstractmethod
+    def _frame(self, tick: int) -> str:
+        """Return the frame text for the given tick"""
+
+    def __rich__(self) -> Text:
+        tick = int((time.monotonic() - self._started_at) / self.interval)
+        return Text(self._frame(tick), style=self.colors.scheme.primary)
+
+    def start(self):
+        """Start animation"""
+        self.is_running = True
+        self._started_at = time.monotonic()
+        self._live = Live(
+            self,
+            console=self.console,
+            refresh_per_second=round(1 / self.interval),
+            transient=True
+        )
+        self._live.start()
+
+    def stop(self):
+        """Stop animation and clear its line"""
+        self.is_running = False
+        if self._live:
+            self._live.stop()
+            self._live = None
+
+
+class ScanAnimation(_LiveAnimation):
+    interval = 0.2
+
     def __init__(self, console: Optional[Console] = None):
         super().__init__(console)
         self.frames = [
@@ -78,69 +122,32 @@ class ScanAnimation(Animation):
         ]
         self.current_frame = 0
 
-    def _animate(self):
-        """Animation loop"""
-        while self.is_running:
-            self.console.print(
-                self.frames[self.current_frame],
-                style=self.colors.scheme.primary,
-                end="\r"
-            )
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            time.sleep(0.2)
+    def _frame(self, tick: int) -> str:
+        """Scan animation frame"""
+        self.current_frame = tick % len(self.frames)
+        return self.frames[self.current_frame]
 
-    def start(self):
-        """Start scan animation"""
-        self.is_running = True
-        self._thread = threading.Thread(target=self._animate, daemon=True)
-        self._thread.start()
 
-    def stop(self):
-        """Stop scan animation"""
-        self.is_running = False
-        if self._thread:
-            self._thread.join()
-        self.console.print(" " * 20, end="\r")  # Clear animation line
+class PulseAnimation(_LiveAnimation):
+    interval = 0.05
 
-
-class PulseAnimation(Animation):
     def __init__(self, console: Optional[Console] = None):
         super().__init__(console)
         self.chars = "█▉▊▋▌▍▎▏"
-        self.direction = 1
+        self.width = 20
         self.position = 0
 
-    def _animate(self):
-        """Pulse animation loop"""
-        while self.is_running:
-            bar = ""
-            for i in range(20):
-                if i == self.position:
-                    bar += self.chars[0]
-                else:
-                    bar += "░"
-            self.console.print(bar, style=self.colors.scheme.primary, end="\r")
-
-            self.position += self.direction
-            if self.position in (0, 19):
-                self.direction *= -1
-            time.sleep(0.05)
+    def _frame(self, tick: int) -> str:
+        """Pulse animation frame, bouncing between both ends of the bar"""
+        period = 2 * (self.width - 1)
+        step = tick % period
+        self.position = step if step < self.width else period - step
+        return "░" * self.position + self.chars[0] + "░" * (self.width - 1 - self.position)
 
-    def start(self):
-        """Start pulse animation"""
-        self.is_running = True
-        self._thread = threading.Thread(target=self._animate, daemon=True)
-        self._thread.start()
-
-    def stop(self):
-        """Stop pulse animation"""
-        self.is_running = False
-        if self._thread:
-            self._thread.join()
-        self.console.print(" " * 20, end="\r")
 
+class NetworkAnimation(_LiveAnimation):
+    interval = 0.1
 
-class NetworkAnimation(Animation):
     def __init__(self, console: Optional[Console] = None):
         super().__init__(console)
         self.frames = [
@@ -157,26 +164,7 @@ class NetworkAnimation(Animation):
         ]
         self.current_frame = 0
 
-    def _animate(self):
-        """Network animation loop"""
-        while self.is_running:
-            self.console.print(
-                self.frames[self.current_frame],
-                style=self.colors.scheme.primary,
-                end="\r"
-            )
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            time.sleep(0.1)
-
-    def start(self):
-        """Start network animation"""
-        self.is_running = True
-        self._thread = threading.Thread(target=self._animate, daemon=True)
-        self._thread.start()
-
-    def stop(self):
-        """Stop network animation"""
-        self.is_running = False
-        if self._thread:
-            self._thread.join()
-        self.console.print(" " * 30, end="\r")
+    def _frame(self, tick: int) -> str:
+        """Network animation frame"""
+        self.current_frame = tick % len(self.frames)
+        return self.frames[self.current_frame]
@@ -1,9 +1,21 @@
-from typing import Dict, List, Optional
+from typing import Dict, Mapping, Optional, Tuple
 from dataclasses import dataclass
+import functools
+from types import MappingProxyType
 from rich.style import Style
 from rich.color import Color
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _make_style(color: Optional[str] = None,
+                bold: Optional[bool] = None,
+                underline: Optional[bool] = None,
+                blink: Optional[bool] = None,
+                bgcolor: Optional[str] = None) -> Style:
+    """Build a Style, sharing one parsed instance per distinct spec"""
+    return Style(color=color, bold=bold, underline=underline, blink=blink, bgcolor=bgcolor)
+
+
+@dataclass(frozen=True, slots=True)
 class ColorScheme:
     primary: str
     secondary: str
@@ -20,7 +32,7 @@ class NexusColors:
     def __init__(self, theme: str = "dark"):
         self.theme = theme
         self.scheme = self._get_color_scheme()
-        self.styles = self._create_styles()
+        self._create_styles()
 
     def _get_color_scheme(self) -> ColorScheme:
         schemes = {
@@ -63,106 +75,123 @@ class NexusColors:
         }
         return schemes.get(self.theme, schemes["dark"])
 
-    def _create_styles(self) -> Dict[str, Style]:
-        return {
-            "header": Style(color=self.scheme.primary, bold=True),
-            "subheader": Style(color=self.scheme.secondary, bold=True),
-            "success": Style(color=self.scheme.success),
-            "warning": Style(color=self.scheme.warning),
-            "error": Style(color=self.scheme.error),
-            "info": Style(color=self.scheme.info),
-            "muted": Style(color=self.scheme.muted),
-            "accent": Style(color=self.scheme.accent),
-            "url": Style(color=self.scheme.primary, underline=True),
-            "code": Style(bgcolor="#202020", color=self.scheme.text),
+    def _create_styles(self):
+        """Build every style and color table once for the active scheme"""
+        self.styles: Dict[str, Style] = {
+            "header": _make_style(color=self.scheme.primary, bold=True),
+            "subheader": _make_style(color=self.scheme.secondary, bold=True),
+            "success": _make_style(color=self.scheme.success),
+            "warning": _make_style(color=self.scheme.warning),
+            "error": _make_style(color=self.scheme.error),
+            "info": _make_style(color=self.scheme.info),
+            "muted": _make_style(color=self.scheme.muted),
+            "accent": _make_style(color=self.scheme.accent),
+            "url": _make_style(color=self.scheme.primary, underline=True),
+            "code": _make_style(bgcolor="#202020", color=self.scheme.text),
         }
 
-    def get_status_color(self, status_code: int) -> str:
-        """Get color based on HTTP status code"""
-        if status_code < 300:
-            return self.scheme.success
-        elif status_code < 400:
-            return self.scheme.info
-        elif status_code < 500:
-            return self.scheme.warning
-        return self.scheme.error
+        # Keyed by status class, clamped to 2xx..5xx
+        self._status_colors = MappingProxyType({
+            2: self.scheme.success,
+            3: self.scheme.info,
+            4: self.scheme.warning,
+            5: self.scheme.error
+        })
 
-    def get_severity_color(self, severity: str) -> str:
-        """Get color based on severity level"""
-        colors = {
+        self._severity_colors = MappingProxyType({
             "CRITICAL": "red1",
             "HIGH": "red3",
             "MEDIUM": "yellow",
             "LOW": "blue",
             "INFO": "green"
-        }
-        return colors.get(severity.upper(), self.scheme.info)
+        })
 
-    def get_chart_colors(self) -> List[str]:
-        """Get colors for charts and graphs"""
-        return [
+        self._chart_colors: Tuple[str, ...] = (
             self.scheme.primary,
             self.scheme.success,
             self.scheme.warning,
             self.scheme.secondary,
             self.scheme.accent,
             self.scheme.error
-        ]
+        )
 
-    def get_progress_colors(self) -> Dict[str, str]:
-        """Get colors for progress bars"""
-        return {
+        self._progress_colors: Mapping[str, str] = MappingProxyType({
             "complete": self.scheme.success,
             "pending": self.scheme.primary,
             "error": self.scheme.error,
             "paused": self.scheme.warning
-        }
+        })
 
-    def get_diff_colors(self) -> Dict[str, str]:
-        """Get colors for diff display"""
-        return {
+        self._diff_colors: Mapping[str, str] = MappingProxyType({
             "added": self.scheme.success,
             "removed": self.scheme.error,
             "modified": self.scheme.warning,
             "unchanged": self.scheme.muted
-        }
+        })
 
-    def get_table_colors(self) -> Dict[str, Style]:
-        """Get colors for table elements"""
-        return {
+        self._table_styles: Mapping[str, Style] = MappingProxyType({
             "header": self.styles["header"],
-            "row": Style(color=self.scheme.text),
-            "alternate_row": Style(color=self.scheme.text, bgcolor="#202020"),
-            "border": Style(color=self.scheme.muted)
-        }
+            "row": _make_style(color=self.scheme.text),
+            "alternate_row": _make_style(color=self.scheme.text, bgcolor="#202020"),
+            "border": _make_style(color=self.scheme.muted)
+        })
 
-    def get_network_colors(self) -> Dict[str, str]:
-        """Get colors for network visualization"""
-        return {
+        self._network_colors: Mapping[str, str] = MappingProxyType({
             "node": self.scheme.primary,
             "edge": self.scheme.secondary,
             "highlight": self.scheme.accent,
             "background": self.scheme.background
-        }
+        })
 
-    def get_syntax_colors(self) -> Dict[str, str]:
-        """Get colors for syntax highlighting"""
-        return {
+        self._syntax_colors: Mapping[str, str] = MappingProxyType({
             "keyword": self.scheme.primary,
             "string": self.scheme.success,
             "number": self.scheme.warning,
             "comment": self.scheme.muted,
             "function": self.scheme.secondary,
             "class": self.scheme.accent
+        })
+
+        self._alert_styles: Dict[str, Style] = {
+            "critical": _make_style(color="red", bold=True, blink=True),
+            "error": _make_style(color=self.scheme.error, bold=True),
+            "warning": _make_style(color=self.scheme.warning),
+            "info": _make_style(color=self.scheme.info),
+            "success": _make_style(color=self.scheme.success)
         }
 
+    def get_status_color(self, status_code: int) -> str:
+        """Get color based on HTTP status code"""
+        return self._status_colors[min(max(status_code // 100, 2), 5)]
+
+    def get_severity_color(self, severity: str) -> str:
+        """Get color based on severity level"""
+        return self._severity_colors.get(severity.upper(), self.scheme.info)
+
+    def get_chart_colors(self) -> Tuple[str, ...]:
+        """Get colors for charts and graphs"""
+        return self._chart_colors
+
+    def get_progress_colors(self) -> Mapping[str, str]:
+        """Get colors for progress bars"""
+        return self._progress_colors
+
+    def get_diff_colors(self) -> Mapping[str, str]:
+        """Get colors for diff display"""
+        return self._diff_colors
+
+    def get_table_colors(self) -> Mapping[str, Style]:
+        """Get colors for table elements"""
+        return self._table_styles
+
+    def get_network_colors(self) -> Mapping[str, str]:
+        """Get colors for network visualization"""
+        return self._network_colors
+
+    def get_syntax_colors(self) -> Mapping[str, str]:
+        """Get colors for syntax highlighting"""
+        return self._syntax_colors
+
     def get_alert_style(self, level: str) -> Style:
         """Get style for alert messages"""
-        styles = {
-            "critical": Style(color="red", bold=True, blink=True),
-            "error": Style(color=self.scheme.error, bold=True),
-            "warning": Style(color=self.scheme.warning),
-            "info": Style(color=self.scheme.info),
-            "success": Style(color=self.scheme.success)
-        }
-        return styles.get(level.lower(), styles["info"])
+        return self._alert_styles.get(level.lower(), self._alert_styles["info"])
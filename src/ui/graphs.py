@@ -3,6 +3,12 @@ from rich.console import Console
 from rich.table import Table
 import math
 import statistics
+import numpy as np
+
+
+# Byte marking a plotted cell in bytearray grids, swapped for the dot symbol on output
+_MARK_BYTE = 0x01
+_MARK = chr(_MARK_BYTE)
 
 
 class ASCIIGraph:
@@ -45,41 +51,33 @@ class ASCIIGraph:
         if not data:
             return
 
-        min_value = min(data)
-        max_value = max(data)
-        value_range = max_value - min_value
-
-        normalized = [
-            int((x - min_value) * (self.graph_height - 1) / value_range)
-            if value_range > 0 else 0
-            for x in data
-        ]
+        values = np.asarray(data, dtype=np.float64)
+        min_value = values.min()
+        max_value = values.max()
+        normalized = self._scale(values, min_value, max_value, self.graph_height).tolist()
 
-        graph = [[' ' for _ in range(len(data))] for _ in range(self.graph_height)]
+        # Single row-major cell grid instead of nested lists
+        width = len(data)
+        grid = bytearray(b' ' * (width * self.graph_height))
 
         for x in range(len(data) - 1):
             y1, y2 = normalized[x], normalized[x + 1]
-            self._draw_line(graph, x, y1, x + 1, y2)
+            self._draw_line(grid, width, x, y1, x + 1, y2)
 
-        self._print_graph(graph, title, min_value, max_value)
+        rows = [
+            grid[row * width:(row + 1) * width].decode('latin1').replace(_MARK, self.symbols['dot'])
+            for row in range(self.graph_height)
+        ]
+        self._print_graph(rows, title, min_value, max_value)
 
     def histogram(self, data: List[float], bins: int = 10, title: str = "Histogram"):
         """Generate ASCII histogram"""
         if not data:
             return
 
-        min_val, max_val = min(data), max(data)
-        bin_width = (max_val - min_val) / bins
-        histogram = [0] * bins
-
-        for value in data:
-            bin_index = min(
-                int((value - min_val) / bin_width),
-                bins - 1
-            )
-            histogram[bin_index] += 1
+        histogram, edges = np.histogram(np.asarray(data, dtype=np.float64), bins=bins)
 
-        max_count = max(histogram)
+        max_count = int(histogram.max())
         scale_factor = self.graph_width / max_count if max_count > 0 else 0
 
         table = Table(title=title, show_header=False, box=None)
@@ -88,8 +86,7 @@ class ASCIIGraph:
         table.add_column("Value", style="yellow", width=10)
 
         for i in range(bins):
-            start = min_val + i * bin_width
-            end = start + bin_width
+            start, end = edges[i], edges[i + 1]
             bar_length = int(histogram[i] * scale_factor)
             bar = self.symbols['bar'] * bar_length
             table.add_row(
@@ -105,19 +102,27 @@ class ASCIIGraph:
         if not x_data or not y_data or len(x_data) != len(y_data):
             return
 
-        x_min, x_max = min(x_data), max(x_data)
-        y_min, y_max = min(y_data), max(y_data)
+        xs = np.asarray(x_data, dtype=np.float64)
+        ys = np.asarray(y_data, dtype=np.float64)
+        x_min, x_max = xs.min(), xs.max()
+        y_min, y_max = ys.min(), ys.max()
+
+        plot_x = self._scale(xs, x_min, x_max, self.graph_width)
+        plot_y = self._scale(ys, y_min, y_max, self.graph_height)
 
-        plot = [[' ' for _ in range(self.graph_width)] for _ in range(self.graph_height)]
+        plot = np.full((self.graph_height, self.graph_width), ' ', dtype='<U1')
+        plot[self.graph_height - 1 - plot_y, plot_x] = self.symbols['dot']
 
-        for x, y in zip(x_data, y_data):
-            plot_x = int((x - x_min) * (self.graph_width - 1) / (x_max - x_min)) if x_max > x_min else 0
-            plot_y = int((y - y_min) * (self.graph_height - 1) / (y_max - y_min)) if y_max > y_min else 0
-            plot[self.graph_height - 1 - plot_y][plot_x] = self.symbols['dot']
+        self._print_graph([''.join(row) for row in plot], title, y_min, y_max)
 
-        self._print_graph(plot, title, y_min, y_max)
+    @staticmethod
+    def _scale(values: np.ndarray, low: float, high: float, size: int) -> np.ndarray:
+        """Map values onto integer cell positions 0..size-1"""
+        if high > low:
+            return ((values - low) * (size - 1) / (high - low)).astype(int)
+        return np.zeros(len(values), dtype=int)
 
-    def _draw_line(self, graph: List[List[str]], x1: int, y1: int, x2: int, y2: int):
+    def _draw_line(self, grid: bytearray, width: int, x1: int, y1: int, x2: int, y2: int):
         """Draw line between two points"""
         if x2 - x1 == 0:
             return
@@ -126,16 +131,16 @@ class ASCIIGraph:
         for x in range(x1, x2 + 1):
             y = int(y1 + slope * (x - x1))
             if 0 <= y < self.graph_height:
-                graph[self.graph_height - 1 - y][x] = self.symbols['dot']
+                grid[(self.graph_height - 1 - y) * width + x] = _MARK_BYTE
 
-    def _print_graph(self, graph: List[List[str]], title: str, min_val: float, max_val: float):
+    def _print_graph(self, rows: List[str], title: str, min_val: float, max_val: float):
         """Print formatted graph"""
         self.console.print(f"\n[bold]{title}[/bold]")
 
         # Print y-axis labels and graph
-        for i, row in enumerate(graph):
+        for i, row in enumerate(rows):
             value = max_val - (i * (max_val - min_val) / (self.graph_height - 1))
-            self.console.print(f"{value:6.2f} {self.symbols['vertical']} {''.join(row)}")
+            self.console.print(f"{value:6.2f} {self.symbols['vertical']} {row}")
 
         # Print x-axis
         self.console.print(f"       {self.symbols['corner']}{self.symbols['line'] * self.graph_width}")
@@ -146,13 +151,16 @@ class ASCIIGraph:
             return
 
         # Calculate statistics
-        sorted_data = sorted(data)
-        q1 = statistics.quantiles(sorted_data, n=4)[0]
-        q2 = statistics.median(sorted_data)
-        q3 = statistics.quantiles(sorted_data, n=4)[2]
+        # Weibull quartiles match statistics.quantiles' default 'exclusive' method
+        # from three points up; below that numpy clamps where statistics extrapolates
+        values = np.asarray(data, dtype=np.float64)
+        if len(values) == 2:
+            q1, q2, q3 = statistics.quantiles(data, n=4)
+        else:
+            q1, q2, q3 = np.percentile(values, [25, 50, 75], method='weibull')
         iqr = q3 - q1
-        whisker_low = max(min(sorted_data), q1 - 1.5 * iqr)
-        whisker_high = min(max(sorted_data), q3 + 1.5 * iqr)
+        whisker_low = max(values.min(), q1 - 1.5 * iqr)
+        whisker_high = min(values.max(), q3 + 1.5 * iqr)
 
         # Generate box plot
         box = f"{whisker_low:.2f} {self.symbols['line']}{'─' * 10}│{q1:.2f}│{'█' * 10}│{q2:.2f}│{'█' * 10}│{q3:.2f}│{'─' * 10}{self.symbols['line']} {whisker_high:.2f}"
@@ -3,7 +3,8 @@ from dataclasses import dataclass
 from enum import Enum
 import curses
 import logging
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
@@ -27,15 +28,42 @@ class MenuItem:
     submenu: Optional['Menu'] = None
 
 
+class BufferedConsole(Console):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_buffer: List[RenderableType] = []
+
+    def write(self, renderable: RenderableType):
+        """Queue renderable for the next flush"""
+        self._line_buffer.append(renderable)
+
+    def writeln(self, renderable: Optional[RenderableType] = None):
+        """Queue renderable and print the whole buffer in one call"""
+        if renderable is not None:
+            self._line_buffer.append(renderable)
+        if not self._line_buffer:
+            return
+        super().print(self.take_frame())
+
+    def take_frame(self) -> Group:
+        """Return buffered renderables as one group and reset the buffer"""
+        frame = Group(*self._line_buffer)
+        self._line_buffer.clear()
+        return frame
+
+
 class Menu:
     def __init__(self, title: str, type: MenuType):
         self.logger = logging.getLogger("nexus.menu")
         self.title = title
         self.type = type
         self.items: Dict[str, MenuItem] = {}
-        self.console = Console()
+        self.console = BufferedConsole()
         self.current_menu: Optional[Menu] = None
         self.parent: Optional[Menu] = None
+        self._live: Optional[Live] = None
+        self._table_cache: Optional[Table] = None
+        self._table_key: Optional[tuple] = None
 
     def add_item(self,
                  key: str,
@@ -63,6 +91,12 @@ class Menu:
         if key in self.items:
             del self.items[key]
 
+    def set_enabled(self, key: str, enabled: bool):
+        """Enable or disable menu item"""
+        item = self.items.get(key)
+        if item:
+            item.enabled = enabled
+
     def display(self):
         """Display menu"""
         self.current_menu = self
@@ -70,31 +104,69 @@ class Menu:
 
     def _render_menu(self):
         """Render current menu"""
-        table = Table(title=self.title)
-        table.add_column("Key", style="cyan")
-        table.add_column("Title", style="green")
-        table.add_column("Description", style="yellow")
-
-        for item in self.items.values():
-            if item.enabled:
-                table.add_row(
-                    item.key,
-                    item.title,
-                    item.description
-                )
-
-        self.console.clear()
-        self.console.print(table)
+        self.console.write(self._get_table())
         self._show_navigation_help()
 
+        if not self.console.is_terminal:
+            self.console.writeln()
+            return
+
+        # Redraw in place inside a live region shared by the whole menu tree
+        root = self._root()
+        if root._live is None:
+            root._live = Live(console=root.console, auto_refresh=False, screen=True)
+            root._live.start()
+        root._live.update(self.console.take_frame(), refresh=True)
+
+    def _get_table(self) -> Table:
+        """Get menu table, rebuilding it only after items change"""
+        # Items are public and mutable, so compare what the table shows
+        table_key = tuple(
+            (item.key, item.title, item.description, item.enabled)
+            for item in self.items.values()
+        )
+        if table_key != self._table_key or self._table_cache is None:
+            table = Table(title=self.title)
+            table.add_column("Key", style="cyan")
+            table.add_column("Title", style="green")
+            table.add_column("Description", style="yellow")
+
+            for item in self.items.values():
+                if item.enabled:
+                    table.add_row(
+                        item.key,
+                        item.title,
+                        item.description
+                    )
+
+            self._table_cache = table
+            self._table_key = table_key
+
+        return self._table_cache
+
+    def _root(self) -> 'Menu':
+        """Get the top-level menu"""
+        menu = self
+        while menu.parent:
+            menu = menu.parent
+        return menu
+
+    def close(self):
+        """Stop the live menu region"""
+        root = self._root()
+        if root._live is not None:
+            root._live.stop()
+            root._live = None
+
     def _show_navigation_help(self):
         """Show navigation help"""
         help_text = "\nNavigation: [b]Enter key to select[/b] | [b]'b' for back[/b] | [b]'q' to quit[/b]"
-        self.console.print(Panel(help_text))
+        self.console.write(Panel(help_text))
 
     def handle_input(self, key: str) -> bool:
         """Handle menu input"""
         if key == 'q':
+            self.close()
             return False
 
         if key == 'b' and self.parent:
@@ -113,6 +185,8 @@ class Menu:
 
     def _execute_callback(self, item: MenuItem):
         """Execute menu item callback"""
+        # Callbacks may print or prompt, so leave the live region first
+        self.close()
         try:
             result = item.callback()
             if result:
@@ -4,6 +4,7 @@ from rich.progress import (
     Progress, TextColumn, BarColumn, TaskID,
     SpinnerColumn, TimeRemainingColumn
 )
+from rich.console import Console
 from rich.live import Live
 from rich.table import Table
 from rich.text import Text
@@ -13,22 +14,41 @@ from .colors import NexusColors
 from ..utils.config import Config
 
 
+SUBTASK_TOTAL = 100
+
+
 @dataclass
 class TaskStats:
-    started_at: float
+    started_at_ns: int
     completed: int
     total: int
-    speed: float
-    eta: float
+
+    @property
+    def speed(self) -> float:
+        """Items completed per second since the task started"""
+        elapsed = (time.monotonic_ns() - self.started_at_ns) / 1e9
+        return self.completed / elapsed if elapsed > 0 else 0
+
+    @property
+    def eta(self) -> float:
+        """Estimated seconds until the task completes"""
+        speed = self.speed
+        return (self.total - self.completed) / speed if speed > 0 else 0
 
 
 class NexusProgress:
+    FLUSH_INTERVAL_NS = 33_000_000
+
     def __init__(self, colors: NexusColors, config: Config):
         self.colors = colors
         self.config = config
         self.tasks: Dict[str, TaskID] = {}
         self.stats: Dict[str, TaskStats] = {}
+        self._pending: Dict[str, int] = {}
+        self._pending_fields: Dict[str, Dict[str, Any]] = {}
+        self._last_flush: Dict[str, int] = {}
 
+        self.console = Console()
         self.progress = Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -38,7 +58,8 @@ class NexusProgress:
             ),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeRemainingColumn(),
-            TextColumn("{task.fields[speed]}/s")
+            TextColumn("{task.fields[speed]}/s"),
+            console=self.console
         )
 
     def add_task(self, name: str, total: int, description: str = None) -> TaskID:
@@ -51,12 +72,13 @@ class NexusProgress:
 
         self.tasks[name] = task_id
         self.stats[name] = TaskStats(
-            started_at=time.time(),
+            started_at_ns=time.monotonic_ns(),
             completed=0,
-            total=total,
-            speed=0.0,
-            eta=0.0
+            total=total
         )
+        self._pending[name] = 0
+        self._pending_fields[name] = {}
+        self._last_flush[name] = time.monotonic_ns()
 
         return task_id
 
@@ -65,20 +87,39 @@ class NexusProgress:
         if name not in self.tasks:
             return
 
-        task_id = self.tasks[name]
         stats = self.stats[name]
 
-        # Update statistics
         stats.completed += advance
-        elapsed = time.time() - stats.started_at
-        stats.speed = stats.completed / elapsed if elapsed > 0 else 0
-        stats.eta = (stats.total - stats.completed) / stats.speed if stats.speed > 0 else 0
 
-        # Update progress
+        # Coalesce renders to at most one per FLUSH_INTERVAL_NS
+        self._pending[name] += advance
+        self._pending_fields[name].update(fields)
+        if (stats.completed >= stats.total or
+                time.monotonic_ns() - self._last_flush[name] >= self.FLUSH_INTERVAL_NS):
+            self._flush_task(name)
+
+    def flush(self, name: Optional[str] = None):
+        """Push pending updates to the progress display"""
+        if name is not None:
+            if name in self.tasks:
+                self._flush_task(name)
+            return
+
+        for task_name in self.tasks:
+            self._flush_task(task_name)
+
+    def _flush_task(self, name: str):
+        """Forward accumulated advance and fields for a single task"""
+        advance = self._pending[name]
+        fields = self._pending_fields[name]
+        self._pending[name] = 0
+        self._pending_fields[name] = {}
+        self._last_flush[name] = time.monotonic_ns()
+
         self.progress.update(
-            task_id,
+            self.tasks[name],
             advance=advance,
-            speed=f"{stats.speed:.1f}",
+            speed=f"{self.stats[name].speed:.1f}",
             **fields
         )
 
@@ -118,20 +159,25 @@ class NexusProgress:
                     TextColumn("{task.completed}/{task.total}")
                 )
                 self.subtasks = {
-                    name: self.subtask_progress.add_task(name, total=100)
+                    name: self.subtask_progress.add_task(name, total=SUBTASK_TOTAL)
                     for name in subtask_names
                 }
+                self._completed = dict.fromkeys(self.subtasks, 0)
 
             def update_subtask(self, name: str, advance: int = 1):
                 if name in self.subtasks:
                     self.subtask_progress.update(self.subtasks[name], advance=advance)
-                    # Update parent task proportionally
-                    total_progress = sum(
-                        self.subtask_progress.tasks[task_id].completed
-                        for task_id in self.subtasks.values()
-                    )
-                    parent_advance = total_progress / len(self.subtasks)
-                    self.parent.update(self.parent_name, advance=parent_advance)
+                    # Update parent task proportionally; the parent coalesces its own renders
+                    self.parent.update(self.parent_name, advance=advance / len(self.subtasks))
+
+                    # Render the parent right away when a subtask finishes, so it never
+                    # waits on a later tick that may not come
+                    self._completed[name] += advance
+                    if self._completed[name] >= SUBTASK_TOTAL:
+                        self.flush()
+
+            def flush(self):
+                self.parent.flush(self.parent_name)
 
         return SubtaskProgress(self, parent_task, subtasks)
 
@@ -164,33 +210,37 @@ class NexusProgress:
 class MultiProgress:
     def __init__(self, parent: NexusProgress):
         self.parent = parent
-        self.progress_bars: Dict[str, Progress] = {}
-
-    def add_progress(self, name: str, total: int) -> Progress:
-        """Add a new independent progress bar"""
-        progress = Progress(
-            TextColumn(f"[blue]{name}"),
+        self.progress = Progress(
+            TextColumn("[blue]{task.description}"),
             BarColumn(
                 complete_style=self.parent.colors.get_color("primary"),
                 finished_style=self.parent.colors.get_color("success")
             ),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("{task.fields[speed]}/s")
+            TextColumn("{task.fields[speed]}/s"),
+            console=self.parent.console
         )
+        self.progress_bars: Dict[str, TaskID] = {}
 
-        self.progress_bars[name] = progress
-        return progress
+    def add_progress(self, name: str, total: int) -> TaskID:
+        """Add a new independent progress bar"""
+        task_id = self.progress.add_task(name, total=total, speed="0.0")
+        self.progress_bars[name] = task_id
+        return task_id
+
+    def update(self, name: str, advance: int = 1, **fields):
+        """Advance a progress bar by name"""
+        if name in self.progress_bars:
+            self.progress.update(self.progress_bars[name], advance=advance, **fields)
 
     def start(self):
         """Start displaying all progress bars"""
-        return Live(self._generate_table(), refresh_per_second=10)
+        return Live(self._generate_table(), console=self.parent.console, refresh_per_second=10)
 
     def _generate_table(self) -> Table:
         """Generate a table containing all progress bars"""
         table = Table(box=None)
         table.add_column("Progress")
-
-        for progress in self.progress_bars.values():
-            table.add_row(progress)
+        table.add_row(self.progress)
 
         return table
@@ -1,19 +1,55 @@
-from typing import Dict, Any, Optional, Union, List
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Union, List, FrozenSet, Iterable, Set
 import threading
+from collections import OrderedDict, defaultdict
+from contextlib import ExitStack
 import json
 from pathlib import Path
 import logging
+import sys
+import time
 from dataclasses import dataclass
 import pickle
+import sqlite3
+from weakref import WeakValueDictionary
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+
+LOCK_SHARDS = 16
+ENTRY_OVERHEAD = 64
+
+_EMPTY_TAGS: FrozenSet[str] = frozenset()
+_TAG_INTERN: "WeakValueDictionary[FrozenSet[str], FrozenSet[str]]" = WeakValueDictionary()
+
+
+def _intern_tags(tags: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Return the shared frozenset for a collection of tags"""
+    if not tags:
+        return _EMPTY_TAGS
+    key = frozenset(tags)
+    interned = _TAG_INTERN.get(key)
+    if interned is None:
+        # The stored value must be a distinct object from the key, otherwise
+        # the key keeps it alive and the weak entry is never dropped
+        interned = _TAG_INTERN.setdefault(key, frozenset(iter(key)))
+    return interned
 
 
 @dataclass
 class CacheEntry:
     key: str
     value: Any
-    expiry: Optional[datetime]
-    tags: List[str]
+    expiry: Optional[float]
+    tags: FrozenSet[str]
+    size: int = 0
 
 
 class CacheHandler:
@@ -21,13 +57,50 @@ class CacheHandler:
         self.logger = logging.getLogger("nexus.cache")
         self.cache_dir = cache_dir
         self.max_size = max_size
-        self.memory_cache: Dict[str, CacheEntry] = {}
-        self.lock = threading.Lock()
+        self.memory_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._tag_index: Dict[str, Set[str]] = defaultdict(set)
+        self._mem_bytes = 0
+        # Per-key operations take a shard lock; the shared LRU order and tag
+        # index are guarded by _index_lock and the connection by _db_lock
+        self._shards = [threading.Lock() for _ in range(LOCK_SHARDS)]
+        self._index_lock = threading.RLock()
+        self._db_lock = threading.Lock()
         self._init_cache_dir()
 
     def _init_cache_dir(self):
-        """Initialize cache directory"""
+        """Initialize cache directory and backing store"""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "cache.sqlite"
+        self._db = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries("
+            "key TEXT PRIMARY KEY, value BLOB, expiry REAL, tags TEXT)"
+        )
+        self._bloom = self._create_bloom()
+        if self._bloom is not None:
+            for (key,) in self._db.execute("SELECT key FROM entries"):
+                self._bloom.add(key)
+
+    def _create_bloom(self):
+        """Create the filter of persisted keys, if pybloom_live is available"""
+        if ScalableBloomFilter is None:
+            return None
+        return ScalableBloomFilter(initial_capacity=self.max_size, error_rate=0.001)
+
+    def close(self):
+        """Close the backing store"""
+        with self._db_lock:
+            self._db.close()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        """Get the shard lock guarding key"""
+        return self._shards[hash(key) & (LOCK_SHARDS - 1)]
 
     def set(self,
             key: str,
@@ -35,17 +108,17 @@ class CacheHandler:
             ttl: Optional[int] = None,
             tags: List[str] = None) -> bool:
         """Set cache entry with optional TTL (in seconds)"""
-        with self.lock:
+        with self._lock_for(key):
             try:
-                expiry = datetime.now() + timedelta(seconds=ttl) if ttl else None
+                expiry = time.monotonic() + ttl if ttl else None
                 entry = CacheEntry(
                     key=key,
                     value=value,
                     expiry=expiry,
-                    tags=tags or []
+                    tags=_intern_tags(tags)
                 )
 
-                self.memory_cache[key] = entry
+                self._track(key, entry)
                 self._persist_to_disk(key, entry)
                 self._enforce_size_limit()
                 return True
@@ -56,17 +129,20 @@ class CacheHandler:
 
     def get(self, key: str) -> Optional[Any]:
         """Get cache entry"""
-        with self.lock:
-            entry = self.memory_cache.get(key)
+        with self._lock_for(key):
+            with self._index_lock:
+                entry = self.memory_cache.get(key)
+                if entry:
+                    self.memory_cache.move_to_end(key)
 
             if not entry:
                 entry = self._load_from_disk(key)
                 if entry:
-                    self.memory_cache[key] = entry
+                    self._track(key, entry)
 
             if entry:
                 if self._is_expired(entry):
-                    self.delete(key)
+                    self._remove(key)
                     return None
                 return entry.value
 
@@ -74,27 +150,60 @@ class CacheHandler:
 
     def delete(self, key: str) -> bool:
         """Delete cache entry"""
-        with self.lock:
-            try:
-                if key in self.memory_cache:
-                    del self.memory_cache[key]
+        with self._lock_for(key):
+            return self._remove(key)
 
-                cache_file = self.cache_dir / f"{key}.cache"
-                if cache_file.exists():
-                    cache_file.unlink()
-                return True
+    def _remove(self, key: str) -> bool:
+        """Delete cache entry from memory and disk (caller holds the key's shard lock)"""
+        try:
+            with self._index_lock:
+                entry = self.memory_cache.pop(key, None)
+                if entry:
+                    self._untrack(key, entry)
+            self._delete_from_disk(key)
+            return True
 
-            except Exception as e:
-                self.logger.error(f"Cache delete error: {str(e)}")
-                return False
+        except Exception as e:
+            self.logger.error(f"Cache delete error: {str(e)}")
+            return False
+
+    def _track(self, key: str, entry: CacheEntry):
+        """Add entry to the memory cache and tag index"""
+        with self._index_lock:
+            previous = self.memory_cache.get(key)
+            if previous:
+                self._untrack(key, previous)
+
+            entry.size = sys.getsizeof(entry.value) + len(key) + ENTRY_OVERHEAD
+            self._mem_bytes += entry.size
+            self.memory_cache[key] = entry
+            self.memory_cache.move_to_end(key)
+            for tag in entry.tags:
+                self._tag_index[tag].add(key)
+
+    def _untrack(self, key: str, entry: CacheEntry):
+        """Drop entry from the tag index and size count (caller holds the index lock)"""
+        self._mem_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
 
     def clear(self) -> bool:
         """Clear all cache entries"""
-        with self.lock:
+        with ExitStack() as stack:
+            for shard in self._shards:
+                stack.enter_context(shard)
             try:
-                self.memory_cache.clear()
-                for cache_file in self.cache_dir.glob("*.cache"):
-                    cache_file.unlink()
+                with self._index_lock:
+                    self.memory_cache.clear()
+                    self._tag_index.clear()
+                    self._mem_bytes = 0
+                with self._db_lock:
+                    self._db.execute("DELETE FROM entries")
+                    self._bloom = self._create_bloom()
                 return True
 
             except Exception as e:
@@ -103,65 +212,120 @@ class CacheHandler:
 
     def get_by_tag(self, tag: str) -> List[Any]:
         """Get all cache entries with specific tag"""
-        with self.lock:
+        with self._index_lock:
             results = []
-            for entry in self.memory_cache.values():
-                if tag in entry.tags and not self._is_expired(entry):
+            for key in self._tag_index.get(tag, ()):
+                entry = self.memory_cache[key]
+                if not self._is_expired(entry):
                     results.append(entry.value)
             return results
 
     def delete_by_tag(self, tag: str) -> int:
         """Delete all cache entries with specific tag"""
-        with self.lock:
-            deleted_count = 0
-            keys_to_delete = []
-
-            for key, entry in self.memory_cache.items():
-                if tag in entry.tags:
-                    keys_to_delete.append(key)
+        with self._index_lock:
+            keys_to_delete = list(self._tag_index.get(tag, ()))
 
-            for key in keys_to_delete:
-                if self.delete(key):
+        deleted_count = 0
+        for key in keys_to_delete:
+            with self._lock_for(key):
+                if self._remove(key):
                     deleted_count += 1
 
-            return deleted_count
+        return deleted_count
 
     def _persist_to_disk(self, key: str, entry: CacheEntry):
         """Persist cache entry to disk"""
         try:
-            cache_file = self.cache_dir / f"{key}.cache"
-            with open(cache_file, 'wb') as f:
-                pickle.dump(entry, f)
+            data = self._serialize(entry.value)
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries(key, value, expiry, tags) VALUES (?, ?, ?, ?)",
+                    (
+                        key,
+                        data,
+                        self._to_wall_clock(entry.expiry),
+                        json.dumps(sorted(entry.tags))
+                    )
+                )
+                if self._bloom is not None:
+                    self._bloom.add(key)
         except Exception as e:
             self.logger.error(f"Cache persistence error: {str(e)}")
 
     def _load_from_disk(self, key: str) -> Optional[CacheEntry]:
         """Load cache entry from disk"""
         try:
-            cache_file = self.cache_dir / f"{key}.cache"
-            if cache_file.exists():
-                with open(cache_file, 'rb') as f:
-                    return pickle.load(f)
+            with self._db_lock:
+                # Keys the filter has never seen cannot be on disk
+                if self._bloom is not None and key not in self._bloom:
+                    return None
+                row = self._db.execute(
+                    "SELECT value, expiry, tags FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+            if row:
+                value, expiry, tags = row
+                return CacheEntry(
+                    key=key,
+                    value=self._deserialize(value),
+                    expiry=self._from_wall_clock(expiry),
+                    tags=_intern_tags(json.loads(tags))
+                )
         except Exception as e:
             self.logger.error(f"Cache load error: {str(e)}")
         return None
 
+    @staticmethod
+    def _serialize(value: Any) -> bytes:
+        """Encode value with msgpack, falling back to pickle"""
+        if msgpack is not None:
+            try:
+                return b'M' + msgpack.packb(value, use_bin_type=True, strict_types=True)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return b'P' + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _deserialize(data: bytes) -> Any:
+        """Decode a value written by _serialize"""
+        if data[:1] == b'M':
+            return msgpack.unpackb(data[1:], raw=False, strict_map_key=False)
+        return pickle.loads(data[1:])
+
     def _is_expired(self, entry: CacheEntry) -> bool:
         """Check if cache entry is expired"""
-        return entry.expiry and datetime.now() > entry.expiry
+        return entry.expiry is not None and time.monotonic() > entry.expiry
+
+    @staticmethod
+    def _to_wall_clock(expiry: Optional[float]) -> Optional[float]:
+        """Convert a monotonic deadline to an epoch timestamp for storage"""
+        if expiry is None:
+            return None
+        return time.time() + (expiry - time.monotonic())
+
+    @staticmethod
+    def _from_wall_clock(expiry: Optional[float]) -> Optional[float]:
+        """Convert a stored epoch timestamp back to a monotonic deadline"""
+        if expiry is None:
+            return None
+        return time.monotonic() + (expiry - time.time())
 
     def _enforce_size_limit(self):
         """Enforce maximum cache size"""
-        if len(self.memory_cache) > self.max_size:
-            # Remove oldest entries
-            sorted_entries = sorted(
-                self.memory_cache.items(),
-                key=lambda x: x[1].expiry or datetime.max
-            )
-            entries_to_remove = len(self.memory_cache) - self.max_size
+        evicted = []
+        with self._index_lock:
+            # Evict least recently used entries
+            while len(self.memory_cache) > self.max_size:
+                key, entry = self.memory_cache.popitem(last=False)
+                self._untrack(key, entry)
+                evicted.append(key)
+
+        for key in evicted:
+            self._delete_from_disk(key)
 
-            for key, _ in sorted_entries[:entries_to_remove]:
-                self.delete(key)
+    def _delete_from_disk(self, key: str):
+        """Remove the persisted copy of an entry"""
+        with self._db_lock:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -174,12 +338,14 @@ class CacheHandler:
 
     def _get_disk_usage(self) -> int:
         """Get total disk usage of cache"""
-        return sum(f.stat().st_size for f in self.cache_dir.glob("*.cache"))
+        with self._db_lock:
+            page_count = self._db.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._db.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
 
     def _get_memory_usage(self) -> int:
         """Estimate memory usage of cache"""
-        import sys
-        return sys.getsizeof(self.memory_cache)
+        return self._mem_bytes
 
     def _get_hit_ratio(self) -> float:
         """Calculate cache hit ratio"""
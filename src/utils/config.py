@@ -1,13 +1,39 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, Optional, Any
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, Optional, Any, Callable
+import copy
+import functools
+import threading
 import yaml
 import os
 from pathlib import Path
 import json
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@dataclass
+
+def _atomic_write(path: str, data: bytes):
+    """Write data through a temporary file renamed over path"""
+    tmp = Path(f"{path}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=16)
+def _load_file(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file, cached until its modification time changes"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+@dataclass(slots=True)
 class ScanConfig:
     threads: int
     timeout: int
@@ -18,7 +44,7 @@ class ScanConfig:
     follow_robots: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class UIConfig:
     theme: str
     animation_speed: float
@@ -26,19 +52,37 @@ class UIConfig:
     show_progress: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     format: str
     path: Optional[Path]
     verbose: bool
 
 
+def _make_applier(cls: type) -> Callable[[Any, Dict[str, Any]], None]:
+    """Generate a function assigning dict values onto a config section in place"""
+    lines = ["def _apply(obj, d):"]
+    for f in fields(cls):
+        lines.append(f"    if {f.name!r} in d: obj.{f.name} = d[{f.name!r}]")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['_apply']
+
+
+_apply_scan = _make_applier(ScanConfig)
+_apply_ui = _make_applier(UIConfig)
+_apply_output = _make_applier(OutputConfig)
+
+
 class Config:
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
         self.scan: ScanConfig = self._create_default_scan_config()
         self.ui: UIConfig = self._create_default_ui_config()
         self.output: OutputConfig = self._create_default_output_config()
+        self._themes: Dict[str, Dict[str, str]] = {}
+        self._themes_colors: Optional[Dict[str, str]] = None
 
         self._load_config()
 
@@ -88,83 +132,47 @@ class Config:
 
     def _load_config(self):
         """Load configuration from file"""
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
-                self._update_config(config_data)
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return
+
+        # Copy so instances never share mutable values with the parse cache
+        config_data = copy.deepcopy(_load_file(self.config_path, mtime_ns))
+        self._update_config(config_data)
 
     def _update_config(self, config_data: Dict[str, Any]):
         """Update configuration with loaded data"""
         if 'scan' in config_data:
-            for key, value in config_data['scan'].items():
-                if hasattr(self.scan, key):
-                    setattr(self.scan, key, value)
+            _apply_scan(self.scan, config_data['scan'])
 
         if 'ui' in config_data:
-            for key, value in config_data['ui'].items():
-                if hasattr(self.ui, key):
-                    setattr(self.ui, key, value)
+            _apply_ui(self.ui, config_data['ui'])
 
         if 'output' in config_data:
-            for key, value in config_data['output'].items():
-                if hasattr(self.output, key):
-                    if key == 'path' and value:
-                        value = Path(value)
-                    setattr(self.output, key, value)
+            output_data = config_data['output']
+            if output_data.get('path'):
+                output_data = {**output_data, 'path': Path(output_data['path'])}
+            _apply_output(self.output, output_data)
 
     def save(self):
         """Save current configuration to file"""
         config_dir = os.path.dirname(self.config_path)
         os.makedirs(config_dir, exist_ok=True)
 
-        config_data = {
-            'scan': {
-                'threads': self.scan.threads,
-                'timeout': self.scan.timeout,
-                'max_depth': self.scan.max_depth,
-                'max_urls': self.scan.max_urls,
-                'user_agent': self.scan.user_agent,
-                'verify_ssl': self.scan.verify_ssl,
-                'follow_robots': self.scan.follow_robots
-            },
-            'ui': {
-                'theme': self.ui.theme,
-                'animation_speed': self.ui.animation_speed,
-                'colors': self.ui.colors,
-                'show_progress': self.ui.show_progress
-            },
-            'output': {
-                'format': self.output.format,
-                'path': str(self.output.path) if self.output.path else None,
-                'verbose': self.output.verbose
-            }
-        }
+        config_data = self.to_dict()
 
-        with open(self.config_path, 'w') as f:
-            yaml.safe_dump(config_data, f, default_flow_style=False)
+        data = yaml.safe_dump(config_data, default_flow_style=False)
+        _atomic_write(self.config_path, data.encode())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
         return {
-            'scan': {
-                'threads': self.scan.threads,
-                'timeout': self.scan.timeout,
-                'max_depth': self.scan.max_depth,
-                'max_urls': self.scan.max_urls,
-                'user_agent': self.scan.user_agent,
-                'verify_ssl': self.scan.verify_ssl,
-                'follow_robots': self.scan.follow_robots
-            },
-            'ui': {
-                'theme': self.ui.theme,
-                'animation_speed': self.ui.animation_speed,
-                'colors': self.ui.colors,
-                'show_progress': self.ui.show_progress
-            },
+            'scan': asdict(self.scan),
+            'ui': asdict(self.ui),
             'output': {
-                'format': self.output.format,
-                'path': str(self.output.path) if self.output.path else None,
-                'verbose': self.output.verbose
+                **asdict(self.output),
+                'path': str(self.output.path) if self.output.path else None
             }
         }
 
@@ -189,9 +197,9 @@ class Config:
         except AssertionError:
             return False
 
-    def get_theme_colors(self) -> Dict[str, str]:
-        """Get theme-specific colors"""
-        themes = {
+    def _build_themes(self) -> Dict[str, Dict[str, str]]:
+        """Precompute the color map for every theme"""
+        return {
             'dark': {
                 'background': '#1a1a1a',
                 'text': '#ffffff',
@@ -203,4 +211,11 @@ class Config:
                 **self.ui.colors
             }
         }
-        return themes.get(self.ui.theme, themes['dark'])
+
+    def get_theme_colors(self) -> Dict[str, str]:
+        """Get theme-specific colors"""
+        # ui.colors may be edited in place or replaced, so rebuild whenever it differs
+        if self._themes_colors != self.ui.colors:
+            self._themes = self._build_themes()
+            self._themes_colors = dict(self.ui.colors)
+        return dict(self._themes.get(self.ui.theme, self._themes['dark']))
@@ -4,20 +4,243 @@ import shutil
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Callable, Dict, Optional, Union, List, Tuple
 from datetime import datetime
 import logging
 import platform
 from urllib.parse import urlparse, urljoin, urlunparse
 import re
 import socket
+import struct
+import threading
+import time
+import functools
+from collections import OrderedDict
 import requests
-from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, Future
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Read buffer for hashing when hashlib.file_digest is unavailable (< 3.11)
+_BUF_SIZE = 1 << 18
+
+# Direct constructors bind straight to the native implementations
+_CTOR = {
+    'sha256': hashlib.sha256,
+    'sha1': hashlib.sha1,
+    'md5': hashlib.md5,
+    'sha512': hashlib.sha512
+}
+
+# Pooled session so repeated probes reuse connections
+_HTTP_TIMEOUT = (3, 5)
+_HTTP_SESSION = requests.Session()
+for _prefix in ('http://', 'https://'):
+    _HTTP_SESSION.mount(_prefix, HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+
+# URL characters: unreserved, sub-delims, gen-delims and percent escapes
+_URL_PATTERN = r"https?://[\w$\-.@&+!*(),%/:;=?#~\[\]]+"
+_URL_RE = re.compile(_URL_PATTERN, re.ASCII)
+
+# Digit runs long enough to overflow a 64-bit integer
+_LONG_NUMBER_RE = re.compile(rb'\d{20,}')
+
+# Absolute URL: RFC 3986 scheme followed by a non-empty authority
+_VALID_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.\-]*://[^\s/?#]+', re.ASCII)
+
+# http(s) URLs that urlparse/urlunparse would only rewrite by lowercasing the scheme
+# and appending an empty path; anything with params, query, fragment, brackets,
+# whitespace or non-ASCII in the host takes the urlparse path
+_SCHEME_RE = re.compile(r'(https?)://[^/?#;\[\]\x00-\x20\x7f-\U0010ffff]+(/[^?#;\x00-\x20]*)?\Z', re.IGNORECASE)
+
+_URL_DB = None
+_HS_LOCAL = threading.local()
+if hyperscan is not None:
+    _URL_DB = hyperscan.Database()
+    _URL_DB.compile(
+        expressions=[_URL_PATTERN.encode()],
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST]
+    )
+
+
+def _hyperscan_urls(content: str) -> List[str]:
+    """Extract URLs with the hyperscan database, matching _URL_RE.findall"""
+    scratch = getattr(_HS_LOCAL, 'scratch', None)
+    if scratch is None:
+        scratch = _HS_LOCAL.scratch = hyperscan.Scratch(_URL_DB)
+
+    # Hyperscan reports every end offset; keep the longest match per start
+    spans: Dict[int, int] = {}
+
+    def on_match(expr_id, start, end, flags, context):
+        if end > spans.get(start, -1):
+            spans[start] = end
+
+    data = content.encode()
+    _URL_DB.scan(data, match_event_handler=on_match, scratch=scratch)
+
+    urls = []
+    last_end = -1
+    for start in sorted(spans):
+        if start >= last_end:
+            last_end = spans[start]
+            urls.append(data[start:last_end].decode())
+    return urls
+
+
+# SO_LINGER on with a zero timeout: close() sends RST instead of entering TIME_WAIT
+_LINGER_ABORT = struct.pack('ii', 1, 0)
+
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_SIZE = 0
+_POOL_LOCK = threading.Lock()
+_POOL_LOCAL = threading.local()
+
+
+def _mark_pool_thread():
+    """Executor initializer flagging threads that belong to the shared pool"""
+    _POOL_LOCAL.in_pool = True
+
+
+def _submit(max_workers: int, func: Callable, *args) -> Future:
+    """Submit to the shared executor, replacing it with a larger one when needed"""
+    global _POOL, _POOL_SIZE
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_SIZE < max_workers:
+            if _POOL is not None:
+                # Work already queued on the old pool still runs to completion
+                _POOL.shutdown(wait=False)
+            _POOL = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='nexus-helper',
+                initializer=_mark_pool_thread
+            )
+            _POOL_SIZE = max_workers
+        return _POOL.submit(func, *args)
+
+
+def _apply_chunk(func: Callable, chunk: list) -> list:
+    """Apply func to every item of a chunk"""
+    return [func(item) for item in chunk]
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info() -> Dict[str, str]:
+    """Collect platform details once; they do not change during the process"""
+    return {
+        'os': platform.system(),
+        'os_version': platform.version(),
+        'architecture': platform.machine(),
+        'python_version': platform.python_version(),
+        'hostname': platform.node()
+    }
+
+
+_PROCESS = None
+
+
+def _process():
+    """Get the psutil handle for this process, recreated after a fork"""
+    global _PROCESS
+    if _PROCESS is None or _PROCESS.pid != os.getpid():
+        _PROCESS = psutil.Process()
+    return _PROCESS
+
+
+DNS_CACHE_TTL = 900
+DNS_CACHE_SIZE = 4096
+DNS_BATCH_WORKERS = 64
+
+
+def _ttl_cache(ttl: float, maxsize: int) -> Callable:
+    """Memoize a single-argument function for ttl seconds with one call in flight per key"""
+    def decorator(func: Callable) -> Callable:
+        cache: OrderedDict = OrderedDict()
+        pending: Dict[Any, Future] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(key):
+            with lock:
+                hit = cache.get(key)
+                if hit and hit[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return hit[1]
+                future = pending.get(key)
+                owner = future is None
+                if owner:
+                    future = pending[key] = Future()
+
+            # Concurrent misses wait for the first caller instead of repeating the work
+            if not owner:
+                return future.result()
+
+            try:
+                value = func(key)
+            except BaseException as e:
+                with lock:
+                    del pending[key]
+                future.set_exception(e)
+                raise
+
+            with lock:
+                cache[key] = (time.monotonic() + ttl, value)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+                del pending[key]
+            future.set_result(value)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_get(key):
+            """Return a fresh cached value without calling func, or None"""
+            with lock:
+                hit = cache.get(key)
+                if hit and hit[0] > time.monotonic():
+                    return hit[1]
+            return None
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_get = cache_get
+        return wrapper
+    return decorator
+
+
+@_ttl_cache(ttl=DNS_CACHE_TTL, maxsize=DNS_CACHE_SIZE)
+def _resolve_dns(domain: str) -> Tuple[str, ...]:
+    """Resolve A records (failed lookups raise and are not cached)"""
+    return tuple(socket.gethostbyname_ex(domain)[2])
+
 
 class URLHelper:
     @staticmethod
     def normalize_url(url: str) -> str:
         """Normalize URL format"""
+        candidate = url if ':' in url else 'http://' + url
+        match = _SCHEME_RE.match(candidate)
+        if match is not None:
+            scheme = match.group(1)
+            normalized = scheme.lower() + candidate[len(scheme):]
+            return normalized if match.group(2) else normalized + '/'
+
         parsed = urlparse(url)
         if not parsed.scheme:
             url = 'http://' + url
@@ -37,11 +260,7 @@ class URLHelper:
     @staticmethod
     def is_valid_url(url: str) -> bool:
         """Check if URL is valid"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        return isinstance(url, str) and _VALID_URL_RE.match(url) is not None
 
     @staticmethod
     def join_urls(base: str, url: str) -> str:
@@ -51,23 +270,43 @@ class URLHelper:
     @staticmethod
     def extract_urls(content: str) -> List[str]:
         """Extract URLs from content"""
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        return re.findall(url_pattern, content)
+        if _URL_DB is not None:
+            return _hyperscan_urls(content)
+        return _URL_RE.findall(content)
 
 class NetworkHelper:
     @staticmethod
     def resolve_dns(domain: str) -> List[str]:
         """Resolve DNS records"""
         try:
-            return socket.gethostbyname_ex(domain)[2]
+            return list(_resolve_dns(domain))
         except socket.gaierror:
             return []
 
+    @staticmethod
+    def resolve_dns_batch(domains: List[str]) -> Dict[str, List[str]]:
+        """Resolve DNS records for many domains concurrently"""
+        results: Dict[str, List[str]] = {}
+        misses = []
+        for domain in dict.fromkeys(domains):
+            cached = _resolve_dns.cache_get(domain)
+            if cached is None:
+                misses.append(domain)
+            else:
+                results[domain] = list(cached)
+
+        # Only cold lookups are handed to threads so their round trips overlap
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(DNS_BATCH_WORKERS, len(misses))) as executor:
+                results.update(zip(misses, executor.map(NetworkHelper.resolve_dns, misses)))
+        return {domain: results[domain] for domain in dict.fromkeys(domains)}
+
     @staticmethod
     def check_port(host: str, port: int, timeout: float = 1.0) -> bool:
         """Check if port is open"""
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_ABORT)
                 sock.settimeout(timeout)
                 return sock.connect_ex((host, port)) == 0
         except Exception:
@@ -77,7 +316,7 @@ class NetworkHelper:
     def get_http_headers(url: str) -> Dict:
         """Get HTTP headers from URL"""
         try:
-            response = requests.head(url, allow_redirects=True)
+            response = _HTTP_SESSION.head(url, allow_redirects=True, timeout=_HTTP_TIMEOUT)
             return dict(response.headers)
         except Exception:
             return {}
@@ -106,10 +345,19 @@ class FileHelper:
     def safe_delete(path: Union[str, Path]) -> bool:
         """Safely delete file or directory"""
         try:
-            if os.path.isdir(path):
-                shutil.rmtree(path)
-            else:
-                os.remove(path)
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            return True
+        except (IsADirectoryError, PermissionError) as e:
+            # Linux reports EISDIR for directories, other platforms EPERM
+            if isinstance(e, PermissionError) and not os.path.isdir(path):
+                return False
+        except OSError:
+            return False
+
+        try:
+            shutil.rmtree(path)
             return True
         except Exception:
             return False
@@ -117,6 +365,8 @@ class FileHelper:
     @staticmethod
     def ensure_dir(path: Union[str, Path]) -> bool:
         """Ensure directory exists"""
+        if os.path.isdir(path):
+            return True
         try:
             os.makedirs(path, exist_ok=True)
             return True
@@ -127,16 +377,26 @@ class HashHelper:
     @staticmethod
     def calculate_file_hash(file_path: Union[str, Path], algorithm: str = 'sha256') -> str:
         """Calculate file hash"""
-        hash_obj = hashlib.new(algorithm)
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                hash_obj.update(chunk)
+        ctor = _CTOR.get(algorithm) or (lambda: hashlib.new(algorithm))
+        with open(file_path, 'rb', buffering=0) as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, ctor).hexdigest()
+
+            hash_obj = ctor()
+            buf = bytearray(_BUF_SIZE)
+            view = memoryview(buf)
+            while True:
+                size = f.readinto(buf)
+                if not size:
+                    break
+                hash_obj.update(view[:size])
         return hash_obj.hexdigest()
 
     @staticmethod
     def calculate_string_hash(text: str, algorithm: str = 'sha256') -> str:
         """Calculate string hash"""
-        hash_obj = hashlib.new(algorithm)
+        ctor = _CTOR.get(algorithm)
+        hash_obj = ctor() if ctor else hashlib.new(algorithm)
         hash_obj.update(text.encode())
         return hash_obj.hexdigest()
 
@@ -144,49 +404,83 @@ class ThreadHelper:
     @staticmethod
     def parallel_execute(func: callable, items: list, max_workers: int = 10) -> list:
         """Execute function in parallel"""
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            return list(executor.map(func, items))
+        items = list(items)
+        # Nested calls would wait on the pool they occupy, so run them inline
+        if getattr(_POOL_LOCAL, 'in_pool', False):
+            return [func(item) for item in items]
+
+        # ThreadPoolExecutor.map ignores chunksize, so batch items explicitly
+        chunksize = max(1, len(items) // (max_workers * 4))
+        chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+        # The pool is shared, so cap this call's in-flight chunks at max_workers
+        slots = threading.BoundedSemaphore(max_workers)
+        futures = []
+        for chunk in chunks:
+            slots.acquire()
+            try:
+                future = _submit(max_workers, _apply_chunk, func, chunk)
+            except BaseException:
+                slots.release()
+                raise
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+        return [result for future in futures for result in future.result()]
+
+    @staticmethod
+    def shutdown_pool(wait: bool = True):
+        """Shut down the shared executor"""
+        global _POOL, _POOL_SIZE
+        with _POOL_LOCK:
+            pool, _POOL, _POOL_SIZE = _POOL, None, 0
+        if pool is not None:
+            pool.shutdown(wait=wait)
 
 class SystemHelper:
     @staticmethod
     def get_system_info() -> Dict[str, str]:
         """Get system information"""
-        return {
-            'os': platform.system(),
-            'os_version': platform.version(),
-            'architecture': platform.machine(),
-            'python_version': platform.python_version(),
-            'hostname': platform.node()
-        }
+        return dict(_system_info())
 
     @staticmethod
     def get_memory_usage() -> Dict[str, int]:
         """Get memory usage"""
-        import psutil
-        process = psutil.Process(os.getpid())
+        if psutil is None:
+            raise ImportError("psutil is required for memory usage reporting")
+        memory = _process().memory_info()
         return {
-            'rss': process.memory_info().rss,
-            'vms': process.memory_info().vms
+            'rss': memory.rss,
+            'vms': memory.vms
         }
 
 class TimeHelper:
     @staticmethod
     def get_timestamp() -> float:
         """Get current timestamp"""
-        return datetime.now().timestamp()
+        return time.time()
 
     @staticmethod
     def format_timestamp(timestamp: float, format_str: str = '%Y-%m-%d %H:%M:%S') -> str:
         """Format timestamp"""
-        return datetime.fromtimestamp(timestamp).strftime(format_str)
+        if '%f' in format_str or '%z' in format_str or '%Z' in format_str:
+            # Microseconds need datetime, and a naive datetime renders zones as empty
+            return datetime.fromtimestamp(timestamp).strftime(format_str)
+        return time.strftime(format_str, time.localtime(timestamp))
 
 class JsonHelper:
     @staticmethod
     def save_json(data: Any, file_path: Union[str, Path], pretty: bool = True) -> bool:
         """Save JSON file"""
         try:
+            # Always the stdlib encoder: orjson cannot indent by four, writes NaN and
+            # Infinity as null and accepts types json rejects. Compact output uses the
+            # C encoder and is written in one call
+            if pretty:
+                payload = json.dumps(data, indent=4)
+            else:
+                payload = json.dumps(data, separators=(',', ':'))
             with open(file_path, 'w') as f:
-                json.dump(data, f, indent=4 if pretty else None)
+                f.write(payload)
             return True
         except Exception:
             return False
@@ -195,8 +489,16 @@ class JsonHelper:
     def load_json(file_path: Union[str, Path]) -> Optional[Any]:
         """Load JSON file"""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            # orjson turns integers wider than 64 bits into floats, so long digit runs
+            # go to the stdlib parser, as do NaN and Infinity literals it rejects
+            if orjson is not None and _LONG_NUMBER_RE.search(raw) is None:
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    pass
+            return json.loads(raw)
         except Exception:
             return None
 
@@ -216,6 +518,8 @@ is_valid_url = url_helper.is_valid_url
 join_urls = url_helper.join_urls
 extract_urls = url_helper.extract_urls
 resolve_dns = network_helper.resolve_dns
+resolve_dns.cache_clear = _resolve_dns.cache_clear
+resolve_dns_batch = network_helper.resolve_dns_batch
 check_port = network_helper.check_port
 get_http_headers = network_helper.get_http_headers
 create_temp_dir = file_helper.create_temp_dir
@@ -225,6 +529,7 @@ ensure_dir = file_helper.ensure_dir
 calculate_file_hash = hash_helper.calculate_file_hash
 calculate_string_hash = hash_helper.calculate_string_hash
 parallel_execute = thread_helper.parallel_execute
+shutdown_pool = thread_helper.shutdown_pool
 get_system_info = system_helper.get_system_info
 get_memory_usage = system_helper.get_memory_usage
 get_timestamp = time_helper.get_timestamp
@@ -1,10 +1,11 @@
 from typing import Dict, List, Callable, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import deque
+import itertools
 import threading
-import queue
 import logging
-from concurrent.futures import ThreadPoolExecutor, Future
-import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from enum import Enum
 
 
@@ -22,24 +23,44 @@ class Task:
     kwargs: dict
     priority: TaskPriority
     timeout: Optional[float] = None
+    future: Future = field(default_factory=Future)
+
+
+class _WorkerQueue:
+    """Per-worker task deques, one per priority, behind a single lock"""
+
+    __slots__ = ('lock', 'queues')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queues: Dict[TaskPriority, deque[Task]] = {
+            priority: deque() for priority in TaskPriority
+        }
 
 
 class ThreadManager:
     def __init__(self, max_workers: int = 10, queue_size: int = 100):
         self.logger = logging.getLogger("nexus.threading")
         self.max_workers = max_workers
-        self.task_queue = queue.PriorityQueue(maxsize=queue_size)
-        self.results: Dict[str, Any] = {}
-        self.active_tasks: Dict[str, Future] = {}
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.queue_size = queue_size
+        self.tasks: Dict[str, Task] = {}
         self.lock = threading.Lock()
+        self._counter = itertools.count()
+        # One token per queued task, and one free slot per allowed queued task
+        self._available = threading.Semaphore(0)
+        self._capacity = threading.Semaphore(queue_size)
+        self._worker_queues = [_WorkerQueue() for _ in range(max_workers)]
         self.running = True
-        self._start_worker()
+        self._start_workers()
 
-    def _start_worker(self):
-        """Start worker thread for task processing"""
-        self.worker_thread = threading.Thread(target=self._process_tasks, daemon=True)
-        self.worker_thread.start()
+    def _start_workers(self):
+        """Start worker threads, each owning one task queue"""
+        self.workers = [
+            threading.Thread(target=self._worker_loop, args=(index,), daemon=True)
+            for index in range(self.max_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
 
     def submit_task(self,
                     func: Callable,
@@ -58,98 +79,138 @@ class ThreadManager:
             timeout=timeout
         )
 
-        self.task_queue.put((priority.value, task))
+        self._capacity.acquire()
+        # Single dict stores are atomic; the lock only guards multi-step updates
+        self.tasks[task_id] = task
+
+        worker_queue = self._worker_queues[hash(task_id) % self.max_workers]
+        with worker_queue.lock:
+            worker_queue.queues[priority].append(task)
+        self._available.release()
         return task_id
 
     def get_result(self, task_id: str, timeout: Optional[float] = None) -> Any:
         """Get task result"""
-        start_time = time.time()
-        while timeout is None or time.time() - start_time < timeout:
-            with self.lock:
-                if task_id in self.results:
-                    return self.results.pop(task_id)
-            time.sleep(0.1)
-        raise TimeoutError("Task result not available within timeout")
+        with self.lock:
+            task = self.tasks.get(task_id)
+        if task is None:
+            raise KeyError(f"Unknown task: {task_id}")
+
+        # A task's own timeout bounds the wait when the caller gives none
+        if timeout is None:
+            timeout = task.timeout
+        try:
+            error = task.future.exception(timeout=timeout)
+        except FuturesTimeoutError:
+            raise TimeoutError("Task result not available within timeout")
+
+        with self.lock:
+            self.tasks.pop(task_id, None)
+        return error if error is not None else task.future.result()
 
     def cancel_task(self, task_id: str) -> bool:
         """Cancel task execution"""
         with self.lock:
-            if task_id in self.active_tasks:
-                future = self.active_tasks[task_id]
-                return future.cancel()
+            task = self.tasks.get(task_id)
+        if task:
+            return task.future.cancel()
         return False
 
     def shutdown(self, wait: bool = True):
         """Shutdown thread manager"""
         self.running = False
-        self.executor.shutdown(wait=wait)
+        for _ in self.workers:
+            self._available.release()
+        self._cancel_queued()
         if wait:
-            self.worker_thread.join()
+            for worker in self.workers:
+                worker.join()
+
+    def _worker_loop(self, index: int):
+        """Run tasks from the worker's own queue, stealing from others when it is empty"""
+        while True:
+            self._available.acquire()
+            if not self.running:
+                return
+
+            # The token guarantees a queued task exists, but a single pass can miss it
+            # when it lands behind the scan while another worker takes the one ahead
+            task = self._take_task(index)
+            while task is None:
+                if not self.running:
+                    return
+                task = self._take_task(index)
+            self._capacity.release()
+
+            if not task.future.set_running_or_notify_cancel():
+                continue
 
-    def _process_tasks(self):
-        """Process tasks from queue"""
-        while self.running:
             try:
-                _, task = self.task_queue.get(timeout=1)
-                future = self.executor.submit(
-                    self._execute_task,
-                    task
-                )
-
-                with self.lock:
-                    self.active_tasks[task.id] = future
-
-                future.add_done_callback(
-                    lambda f, task_id=task.id: self._handle_completion(task_id, f)
-                )
-
-            except queue.Empty:
-                continue
+                result = self._execute_task(task)
             except Exception as e:
-                self.logger.error(f"Task processing error: {str(e)}")
+                task.future.set_exception(e)
+            else:
+                task.future.set_result(result)
+
+    def _take_task(self, index: int) -> Optional[Task]:
+        """Pop from own tail or steal from another worker's head, highest priority first"""
+        own = self._worker_queues[index]
+        for priority in TaskPriority:
+            with own.lock:
+                queue = own.queues[priority]
+                if queue:
+                    return queue.pop()
+
+            for offset in range(1, self.max_workers):
+                victim = self._worker_queues[(index + offset) % self.max_workers]
+                with victim.lock:
+                    queue = victim.queues[priority]
+                    if queue:
+                        return queue.popleft()
+        return None
+
+    def _cancel_queued(self):
+        """Cancel tasks that were never started"""
+        for worker_queue in self._worker_queues:
+            with worker_queue.lock:
+                for queue in worker_queue.queues.values():
+                    while queue:
+                        queue.popleft().future.cancel()
 
     def _execute_task(self, task: Task) -> Any:
         """Execute single task"""
         try:
-            if task.timeout:
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(task.func, *task.args, **task.kwargs)
-                    return future.result(timeout=task.timeout)
             return task.func(*task.args, **task.kwargs)
         except Exception as e:
             self.logger.error(f"Task execution error: {str(e)}")
             raise
 
-    def _handle_completion(self, task_id: str, future: Future):
-        """Handle task completion"""
-        with self.lock:
-            try:
-                self.results[task_id] = future.result()
-            except Exception as e:
-                self.results[task_id] = e
-            finally:
-                self.active_tasks.pop(task_id, None)
-
     def _generate_task_id(self) -> str:
         """Generate unique task ID"""
-        import uuid
-        return str(uuid.uuid4())
+        return f'{next(self._counter):x}'
 
     def get_stats(self) -> Dict[str, Any]:
         """Get thread manager statistics"""
+        # list() copies the dict in one step under the GIL, so readers need not take the lock
+        futures = [task.future for task in list(self.tasks.values())]
         return {
-            'active_tasks': len(self.active_tasks),
-            'queued_tasks': self.task_queue.qsize(),
-            'completed_tasks': len(self.results),
+            'active_tasks': sum(1 for future in futures if future.running()),
+            'queued_tasks': sum(
+                len(queue)
+                for worker_queue in self._worker_queues
+                for queue in worker_queue.queues.values()
+            ),
+            'completed_tasks': sum(1 for future in futures if future.done()),
             'worker_threads': self.max_workers
         }
 
     def get_active_tasks(self) -> List[str]:
         """Get list of active task IDs"""
-        with self.lock:
-            return list(self.active_tasks.keys())
+        return [task_id for task_id, task in list(self.tasks.items()) if task.future.running()]
 
     def clear_results(self):
         """Clear completed task results"""
         with self.lock:
-            self.results.clear()
+            for task_id, task in list(self.tasks.items()):
+                if task.future.done():
+                    self.tasks.pop(task_id, None)
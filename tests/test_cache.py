@@ -0,0 +1,95 @@
+import time
+import pytest
+from src.utils.cache import CacheHandler
+
+
+class TestCacheHandler:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = CacheHandler(tmp_path, max_size=3)
+        yield cache
+        cache.close()
+
+    def test_round_trip_across_instances(self, cache, tmp_path):
+        cache.set("dict", {"ports": [22, 80], "host": "example.com"}, tags=["scan"])
+        cache.set("bytes", b"\x00raw", ttl=60)
+        cache.set("set", {1, 2, 3})
+        cache.close()
+
+        reopened = CacheHandler(tmp_path)
+        try:
+            assert reopened.get("dict") == {"ports": [22, 80], "host": "example.com"}
+            assert reopened.get("bytes") == b"\x00raw"
+            assert reopened.get("set") == {1, 2, 3}
+            assert reopened.get("missing") is None
+            assert reopened.get_by_tag("scan") == [{"ports": [22, 80], "host": "example.com"}]
+        finally:
+            reopened.close()
+
+    def test_ttl_expiry(self, cache):
+        cache.set("short", "value", ttl=60)
+        cache.set("forever", "value")
+        assert cache.get("short") == "value"
+
+        cache.memory_cache["short"].expiry = time.monotonic() - 1
+        assert cache.get("short") is None
+        assert "short" not in cache.memory_cache
+        assert cache.get("forever") == "value"
+
+    def test_ttl_expiry_on_disk(self, cache, tmp_path):
+        cache.set("short", "value", ttl=60)
+        cache._db.execute("UPDATE entries SET expiry = ? WHERE key = ?", (time.time() - 1, "short"))
+        cache.close()
+
+        reopened = CacheHandler(tmp_path)
+        try:
+            assert reopened.get("short") is None
+            assert reopened._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+        finally:
+            reopened.close()
+
+    def test_eviction_order(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        # Touching "a" makes "b" the least recently used entry
+        assert cache.get("a") == "a"
+        cache.set("d", "d")
+
+        assert list(cache.memory_cache) == ["c", "a", "d"]
+        assert cache.get("b") is None
+        assert cache.get_stats()["total_entries"] == 3
+
+    def test_memory_usage_tracks_entries(self, cache):
+        cache.set("a", "x" * 100)
+        cache.set("a", "x" * 10)
+        cache.set("b", "y")
+        expected = sum(entry.size for entry in cache.memory_cache.values())
+        assert cache._mem_bytes == expected
+        cache.delete("a")
+        cache.delete("b")
+        assert cache._mem_bytes == 0
+
+    def test_tag_invalidation(self, cache):
+        cache.set("a", 1, tags=["web"])
+        cache.set("b", 2, tags=["web", "ssl"])
+        cache.set("c", 3, tags=["ssl"])
+
+        assert sorted(cache.get_by_tag("web")) == [1, 2]
+        assert cache.delete_by_tag("web") == 2
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get_by_tag("web") == []
+        assert cache.get_by_tag("ssl") == [3]
+
+    def test_retag_drops_old_tags(self, cache):
+        cache.set("a", 1, tags=["old"])
+        cache.set("a", 2, tags=["new"])
+        assert cache.get_by_tag("old") == []
+        assert cache.get_by_tag("new") == [2]
+
+    def test_clear(self, cache):
+        cache.set("a", 1, tags=["web"])
+        assert cache.clear()
+        assert cache.get("a") is None
+        assert cache.get_by_tag("web") == []
+        assert cache.get_stats()["total_entries"] == 0
@@ -0,0 +1,82 @@
+from pathlib import Path
+import pytest
+import yaml
+from src.utils.config import Config
+
+SAMPLE_UPDATES = [
+    {},
+    {'scan': {'threads': 50, 'timeout': 10}},
+    {'scan': {'user_agent': 'Custom/2.0', 'unknown_option': True}},
+    {'ui': {'theme': 'light', 'colors': {'primary': 'magenta'}, 'show_progress': False}},
+    {'ui': {'animation_speed': 0.5, 'legacy_key': 'ignored'}},
+    {'output': {'format': 'json', 'path': '/tmp/report.json', 'verbose': True}},
+    {'output': {'path': ''}},
+    {'output': {'path': None, 'extra': 1}},
+    {
+        'scan': {'max_depth': 5, 'verify_ssl': False, 'follow_robots': False, 'max_urls': 10},
+        'ui': {'theme': 'dark'},
+        'output': {'format': 'html', 'path': 'reports/out.html'},
+        'plugins': {'enabled': ['dns']}
+    },
+]
+
+
+def baseline_update(config, config_data):
+    """The original setattr loop, kept as the reference for applier parity"""
+    for section in ('scan', 'ui', 'output'):
+        if section not in config_data:
+            continue
+        target = getattr(config, section)
+        for key, value in config_data[section].items():
+            if hasattr(target, key):
+                if section == 'output' and key == 'path' and value:
+                    value = Path(value)
+                setattr(target, key, value)
+
+
+class TestConfig:
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        return str(tmp_path / "config.yaml")
+
+    @pytest.mark.parametrize("config_data", SAMPLE_UPDATES)
+    def test_appliers_match_setattr_loop(self, config_path, config_data):
+        expected = Config(config_path)
+        baseline_update(expected, config_data)
+
+        config = Config(config_path)
+        config._update_config(config_data)
+
+        assert config.scan == expected.scan
+        assert config.ui == expected.ui
+        assert config.output == expected.output
+        assert type(config.output.path) is type(expected.output.path)
+
+    def test_unknown_keys_are_ignored(self, config_path):
+        config = Config(config_path)
+        config._update_config({'scan': {'unknown_option': True}})
+        assert not hasattr(config.scan, 'unknown_option')
+
+    def test_load_from_file(self, config_path):
+        with open(config_path, 'w') as f:
+            yaml.safe_dump({
+                'scan': {'threads': 20},
+                'ui': {'colors': {'primary': 'magenta'}},
+                'output': {'path': 'out.json'}
+            }, f)
+
+        config = Config(config_path)
+        assert config.scan.threads == 20
+        assert config.output.path == Path('out.json')
+
+        # Instances must not share mutable values through the parse cache
+        config.ui.colors['primary'] = 'white'
+        assert Config(config_path).ui.colors['primary'] == 'magenta'
+
+    def test_save_round_trip(self, config_path):
+        config = Config(config_path)
+        config._update_config({'scan': {'threads': 42}, 'output': {'path': 'out.html'}})
+        config.save()
+
+        reloaded = Config(config_path)
+        assert reloaded.to_dict() == config.to_dict()
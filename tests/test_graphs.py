@@ -0,0 +1,27 @@
+import io
+import statistics
+import pytest
+from rich.console import Console
+from src.ui.graphs import ASCIIGraph
+
+
+class TestBoxPlot:
+    @pytest.fixture
+    def output(self):
+        return io.StringIO()
+
+    @pytest.fixture
+    def graph(self, output):
+        return ASCIIGraph(Console(file=output, width=200))
+
+    @pytest.mark.parametrize("data", [
+        [1, 2],
+        [3, 1, 2],
+        [5, 1, 4, 2, 8, 7]
+    ])
+    def test_quartiles_match_statistics(self, graph, output, data):
+        graph.box_plot(data)
+        q1, q2, q3 = statistics.quantiles(data, n=4)
+        assert f"│{q1:.2f}│" in output.getvalue()
+        assert f"│{q2:.2f}│" in output.getvalue()
+        assert f"│{q3:.2f}│" in output.getvalue()
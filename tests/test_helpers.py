@@ -0,0 +1,20 @@
+from datetime import datetime
+import pytest
+from src.utils.helpers import format_timestamp
+
+
+class TestTimeHelper:
+    TIMESTAMP = 1700000000.123456
+
+    @pytest.mark.parametrize("format_str", [
+        "%Y-%m-%d %H:%M:%S",
+        "%H:%M:%S.%f",
+        "%Y-%m-%d %H:%M:%S %z",
+        "[%Z] %a %j"
+    ])
+    def test_format_timestamp_matches_datetime(self, format_str):
+        expected = datetime.fromtimestamp(self.TIMESTAMP).strftime(format_str)
+        assert format_timestamp(self.TIMESTAMP, format_str) == expected
+
+    def test_zone_directives_render_empty(self):
+        assert format_timestamp(self.TIMESTAMP, "%z|%Z") == "|"
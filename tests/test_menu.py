@@ -0,0 +1,27 @@
+import pytest
+from src.ui.menu import Menu, MenuType
+
+
+class TestMenuTable:
+    @pytest.fixture
+    def menu(self):
+        menu = Menu("Test Menu", MenuType.MAIN)
+        menu.add_item("1", "First", lambda: None, "First item")
+        menu.add_item("2", "Second", lambda: None, "Second item")
+        return menu
+
+    def test_table_is_cached(self, menu):
+        assert menu._get_table() is menu._get_table()
+
+    def test_direct_item_mutation_rebuilds_table(self, menu):
+        assert menu._get_table().row_count == 2
+
+        menu.items["1"].enabled = False
+        assert menu._get_table().row_count == 1
+
+        menu.items["2"].title = "Renamed"
+        assert list(menu._get_table().columns[1].cells) == ["Renamed"]
+
+    def test_set_enabled(self, menu):
+        menu.set_enabled("2", False)
+        assert list(menu._get_table().columns[0].cells) == ["1"]
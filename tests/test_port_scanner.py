@@ -0,0 +1,128 @@
+import asyncio
+import socket
+import struct
+import pytest
+from src.scanners.port_scanner import PortScanner
+
+SOURCE = "10.0.0.1"
+TARGET = "10.0.0.2"
+SYN_ACK = 0x12
+RST = 0x14
+
+
+def ip_tcp_reply(src: str, src_port: int, dst_port: int, flags: int) -> bytes:
+    """Build a minimal IPv4 + TCP reply as a raw socket would return it"""
+    ip_header = struct.pack(
+        '!BBHHHBBH4s4s',
+        0x45, 0, 40, 0, 0, 64, socket.IPPROTO_TCP, 0,
+        socket.inet_aton(src), socket.inet_aton(SOURCE)
+    )
+    tcp_header = struct.pack(
+        '!HHIIBBHHH',
+        src_port, dst_port, 0, 1, 5 << 4, flags, 1024, 0, 0
+    )
+    return ip_header + tcp_header
+
+
+class FakeRawSocket:
+    """Raw socket stand-in that answers each SYN through a socketpair"""
+
+    def __init__(self, responder):
+        self.reader, self.writer = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.responder = responder
+        self.sent = []
+
+    def setblocking(self, flag):
+        self.reader.setblocking(flag)
+
+    def fileno(self):
+        return self.reader.fileno()
+
+    def recv(self, size):
+        return self.reader.recv(size)
+
+    def sendto(self, packet, address):
+        source_port, port = struct.unpack('!HH', packet[:4])
+        for reply in self.responder(self, port, source_port):
+            self.writer.send(reply)
+        self.sent.append(port)
+        return len(packet)
+
+    def close(self):
+        self.reader.close()
+        self.writer.close()
+
+
+class TestSynPackets:
+    @pytest.fixture
+    def scanner(self):
+        return PortScanner(timeout=0.2, raw_syn=True)
+
+    def test_syn_packet_checksum(self, scanner):
+        packet = scanner._build_syn_packet(SOURCE, TARGET, 40000, 443)
+        source_port, port, _, ack, offset, flags = struct.unpack('!HHIIBB', packet[:14])
+        assert (source_port, port, ack, offset >> 4, flags) == (40000, 443, 0, 5, 0x02)
+
+        pseudo_header = socket.inet_aton(SOURCE) + socket.inet_aton(TARGET) + struct.pack(
+            '!BBH', 0, socket.IPPROTO_TCP, len(packet)
+        )
+        # A segment carrying a correct checksum sums to zero
+        assert scanner._checksum(pseudo_header + packet) == 0
+
+    def test_checksum_odd_length(self, scanner):
+        assert scanner._checksum(b'\x01') == scanner._checksum(b'\x01\x00')
+
+    def test_parse_syn_ack(self, scanner):
+        packet = ip_tcp_reply(TARGET, 443, 40000, SYN_ACK)
+        assert scanner._parse_syn_reply(packet, TARGET, 40000) == (443, 'open')
+
+    def test_parse_rst(self, scanner):
+        packet = ip_tcp_reply(TARGET, 81, 40000, RST)
+        assert scanner._parse_syn_reply(packet, TARGET, 40000) == (81, 'closed')
+
+    def test_parse_ignores_unrelated_replies(self, scanner):
+        assert scanner._parse_syn_reply(ip_tcp_reply("10.0.0.3", 443, 40000, SYN_ACK), TARGET, 40000) is None
+        assert scanner._parse_syn_reply(ip_tcp_reply(TARGET, 443, 40001, SYN_ACK), TARGET, 40000) is None
+        assert scanner._parse_syn_reply(ip_tcp_reply(TARGET, 443, 40000, 0x10), TARGET, 40000) is None
+        assert scanner._parse_syn_reply(ip_tcp_reply(TARGET, 443, 40000, SYN_ACK)[:30], TARGET, 40000) is None
+
+    def test_syn_scan_ignores_unprobed_ports(self, scanner, monkeypatch):
+        real_socket = socket.socket
+        raw_sockets = []
+        blocked = set()
+
+        def responder(sock, port, source_port):
+            if port == 22:
+                # A stale RST for port 80 arrives before its SYN is sent
+                return [ip_tcp_reply(TARGET, 80, source_port, RST)]
+            if port == 80:
+                return [ip_tcp_reply(TARGET, 80, source_port, SYN_ACK)]
+            return [ip_tcp_reply(TARGET, port, source_port, RST)]
+
+        def fake_socket(family=-1, type=-1, *args, **kwargs):
+            if type == socket.SOCK_RAW:
+                sock = FakeRawSocket(responder)
+                sendto = sock.sendto
+
+                def sendto_once_blocked(packet, address):
+                    # Yield to the event loop before sending port 80 so the stale reply is read first
+                    port = struct.unpack('!H', packet[2:4])[0]
+                    if port == 80 and port not in blocked:
+                        blocked.add(port)
+                        raise BlockingIOError
+                    return sendto(packet, address)
+
+                sock.sendto = sendto_once_blocked
+                raw_sockets.append(sock)
+                return sock
+            return real_socket(family, type, *args, **kwargs)
+
+        monkeypatch.setattr(socket, "socket", fake_socket)
+        monkeypatch.setattr(scanner, "_get_source_address", lambda address: SOURCE)
+
+        results = asyncio.run(scanner._syn_scan(TARGET, [22, 80, 8080]))
+
+        assert raw_sockets[0].sent == [22, 80, 8080]
+        assert {result.port: result.state for result in results} == {
+            22: 'filtered', 80: 'open', 8080: 'closed'
+        }
@@ -0,0 +1,32 @@
+import pytest
+from unittest.mock import Mock
+from src.ui.progress import NexusProgress
+from src.utils.config import Config
+
+
+class TestSubtaskProgress:
+    @pytest.fixture
+    def progress(self, tmp_path):
+        progress = NexusProgress(Mock(**{"get_color.return_value": "cyan"}), Config(str(tmp_path / "config.yaml")))
+        progress.add_task("scan", total=100)
+        return progress
+
+    def _shown(self, progress: NexusProgress) -> float:
+        return progress.progress.tasks[0].completed
+
+    def test_finished_subtask_reaches_parent(self, progress):
+        names = [f"s{i}" for i in range(8)]
+        subtasks = progress.create_subtask_progress("scan", names)
+        for name in names:
+            subtasks.update_subtask(name, advance=50)
+        subtasks.update_subtask("s0", advance=50)
+
+        assert progress.stats["scan"].completed == pytest.approx(56.25)
+        assert self._shown(progress) == pytest.approx(56.25)
+
+    def test_all_subtasks_finished(self, progress):
+        subtasks = progress.create_subtask_progress("scan", ["a", "b", "c"])
+        for name in ["a", "b", "c"]:
+            subtasks.update_subtask(name, advance=100)
+
+        assert self._shown(progress) == pytest.approx(100)
@@ -7,7 +7,7 @@ from rich.tree import Tree
 from rich.console import Console
 
 class TestReporters:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def tree_reporter(self):
         return TreeViewReporter(Console())
 
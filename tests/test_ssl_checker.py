@@ -0,0 +1,34 @@
+import asyncio
+import socket
+import time
+import pytest
+from src.scanners.ssl_checker import SSLChecker
+
+
+class TestSSLChecker:
+    @pytest.fixture
+    def silent_port(self):
+        # Accepts TCP connections through the backlog but never answers the handshake
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen(256)
+            yield sock.getsockname()[1]
+
+    @pytest.fixture
+    def checker(self):
+        checker = SSLChecker(timeout=0.5, concurrent_checks=10)
+        yield checker
+        checker.executor.shutdown()
+
+    def test_silent_host_fails_after_one_timeout(self, checker, silent_port):
+        started = time.monotonic()
+        with pytest.raises(OSError):
+            asyncio.run(checker.check_ssl("127.0.0.1", silent_port))
+        assert time.monotonic() - started < 2 * checker.timeout
+
+    def test_cipher_probes_stop_after_timeout(self, checker, silent_port):
+        started = time.monotonic()
+        ciphers = asyncio.run(checker._check_cipher_suites("127.0.0.1", silent_port))
+        assert ciphers == []
+        # Only the first wave of concurrent probes waits for the timeout
+        assert time.monotonic() - started < 2 * checker.timeout
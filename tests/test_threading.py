@@ -0,0 +1,31 @@
+import threading
+import pytest
+from src.utils.threading import ThreadManager, TaskPriority
+
+
+class TestThreadManager:
+    @pytest.fixture
+    def manager(self):
+        manager = ThreadManager(max_workers=2, queue_size=10)
+        yield manager
+        manager.shutdown()
+
+    def test_task_result(self, manager):
+        task_id = manager.submit_task(lambda x: x * 2, 21)
+        assert manager.get_result(task_id, timeout=2) == 42
+
+    def test_missed_scan_keeps_token(self, manager, monkeypatch):
+        # Simulate a worker whose first scan misses a task that is already queued
+        take_task = manager._take_task
+        missed = threading.Event()
+
+        def flaky_take_task(index):
+            if not missed.is_set():
+                missed.set()
+                return None
+            return take_task(index)
+
+        monkeypatch.setattr(manager, "_take_task", flaky_take_task)
+        task_id = manager.submit_task(lambda: "done", priority=TaskPriority.HIGH)
+        assert manager.get_result(task_id, timeout=2) == "done"
+        assert missed.is_set()
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from src.scanners import waf_detector
+from src.scanners.waf_detector import WAFDetector
+
+
+SIGNATURES = {
+    "Cloudflare": {
+        "headers": {"Server": "cloudflare"},
+        "status_codes": [403],
+        "body_patterns": ["cloudflare", "cloudflare ray id"]
+    },
+    "ModSecurity": {
+        "headers": {"Server": "mod_security"},
+        "status_codes": [406],
+        "body_patterns": ["mod_security", "not acceptable"]
+    }
+}
+
+
+SCORING_SIGNATURES = {
+    "Cloudflare": {
+        "headers": {"Server": "cloudflare", "CF-RAY": ""},
+        "status_codes": [403, 503],
+        "body_patterns": ["cloudflare", "cloudflare ray id", "Attention Required"]
+    },
+    "Sucuri": {
+        "headers": {"X-Sucuri-ID": ""},
+        "status_codes": [403],
+        "body_patterns": ["sucuri", "access denied", "Sucuri WebSite Firewall"]
+    },
+    "Generic": {
+        "status_codes": [406],
+        "body_patterns": ["access denied", "request blocked", "blocked"]
+    }
+}
+
+SAMPLE_RESPONSES = [
+    (200, {}, "<html>hello world</html>"),
+    (403, {}, "plain forbidden"),
+    (403, {"Server": "cloudflare"}, "forbidden"),
+    (200, {"server": "CloudFlare"}, "Attention Required! | Cloudflare Ray ID: 42"),
+    (200, {}, "cloudflare ray id only"),
+    (403, {}, "Access Denied by Sucuri WebSite Firewall"),
+    (200, {}, "ACCESS DENIED - request blocked"),
+    (406, {}, "blocked"),
+    (503, {"Content-Type": "text/html"}, ""),
+    (200, {"X-Sucuri-ID": "12345"}, "ok"),
+    (200, {}, "sucuri access denied"),
+]
+
+
+def baseline_analyze(signatures, status, headers, body):
+    """The original per-signature scorer, kept as the reference for scoring parity"""
+    headers_lc = {name.lower(): value for name, value in headers.items()}
+    for waf_name, signature in signatures.items():
+        confidence = 0.0
+        if status in signature.get('status_codes', []):
+            confidence += 0.3
+        if 'headers' in signature:
+            header_confidence = 0.0
+            for header, pattern in signature['headers'].items():
+                if header.lower() in headers_lc and pattern.lower() in headers_lc[header.lower()].lower():
+                    header_confidence += 0.3
+            confidence += min(header_confidence, 1.0)
+        if 'body_patterns' in signature:
+            for pattern in signature['body_patterns']:
+                if pattern.lower() in body.lower():
+                    confidence += 0.3
+        if confidence > 0.5:
+            return waf_name, confidence
+    return None
+
+
+class _BlockingHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b"Attention Required! Cloudflare Ray ID: 1234"
+        self.send_response(403)
+        self.send_header("Server", "cloudflare")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestWAFDetector:
+    @pytest.fixture
+    def signatures_path(self, tmp_path):
+        path = tmp_path / "waf_signatures.json"
+        path.write_text(json.dumps(SIGNATURES))
+        return path
+
+    @pytest.fixture
+    def server_url(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _BlockingHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+        server.shutdown()
+        server.server_close()
+
+    def test_detect_waf_across_event_loops(self, signatures_path, server_url):
+        # The CLI runs one asyncio.run per target on the same detector
+        detector = WAFDetector(signatures_path=str(signatures_path), cache_ttl=0)
+        first = asyncio.run(detector.detect_waf(server_url))
+        second = asyncio.run(detector.detect_waf(server_url))
+        asyncio.run(detector.aclose())
+
+        assert first is not None and first.name == "Cloudflare"
+        assert second is not None and second.name == "Cloudflare"
+
+    def test_failed_probes_are_not_cached(self, signatures_path, server_url):
+        detector = WAFDetector(signatures_path=str(signatures_path))
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            closed_url = f"http://127.0.0.1:{sock.getsockname()[1]}/"
+
+        async def detect_both():
+            async with detector:
+                return await detector.detect_waf(closed_url), await detector.detect_waf(server_url)
+
+        unreachable, detected = asyncio.run(detect_both())
+        assert unreachable is None
+        assert detected is not None
+        assert list(detector._host_cache) == [("http", server_url[len("http://"):-1])]
+
+
+class TestWAFScoring:
+    @pytest.fixture
+    def signatures_path(self, tmp_path):
+        path = tmp_path / "waf_signatures.json"
+        path.write_text(json.dumps(SCORING_SIGNATURES))
+        return path
+
+    def assert_baseline_parity(self, detector):
+        for status, headers, body in SAMPLE_RESPONSES:
+            expected = baseline_analyze(SCORING_SIGNATURES, status, headers, body)
+            detection = detector._analyze_response(status, headers, body)
+            if detection is not None and detection.details['detected_by'] == 'headers':
+                # Header-only matches below the threshold fall through to the passive check
+                detection = None
+            if expected is None:
+                assert detection is None, (status, headers, body)
+            else:
+                assert detection is not None, (status, headers, body)
+                assert detection.name == expected[0]
+                assert detection.confidence == pytest.approx(expected[1])
+
+    def test_regex_prefilter_matches_baseline(self, signatures_path, monkeypatch):
+        monkeypatch.setattr(waf_detector, "ahocorasick", None)
+        detector = WAFDetector(signatures_path=str(signatures_path))
+        assert detector._body_matcher is None and detector._body_re is not None
+        self.assert_baseline_parity(detector)
+
+    @pytest.mark.skipif(waf_detector.ahocorasick is None, reason="pyahocorasick not installed")
+    def test_automaton_matches_baseline(self, signatures_path):
+        detector = WAFDetector(signatures_path=str(signatures_path))
+        assert detector._body_matcher is not None
+        self.assert_baseline_parity(detector)
+
+    def test_overlapping_body_patterns_all_count(self, signatures_path, monkeypatch):
+        monkeypatch.setattr(waf_detector, "ahocorasick", None)
+        detector = WAFDetector(signatures_path=str(signatures_path))
+        scores = detector._score_body("Cloudflare Ray ID: 42")
+        assert scores["Cloudflare"] == pytest.approx(0.6)
+        assert detector._score_body("nothing to see") == {}
+